@@ -10,15 +10,15 @@ from datetime import datetime, timezone
 from schema import (
     FileMetaRequest, FileMetaResponse,
     ChunkConfirmRequest, ChunkConfirmResponse,
-    FolderRequest, FolderResponse,
+    FolderRequest, FolderResponse, BulkFolderRequest, BulkFolderResponse,
     DownloadRequest, DownloadResponse, DownloadUrlResponse,
     SyncRequest, SyncResponse, SyncFileInfo, SyncChunkInfo
 )
 from utils.files import create_file_metadata, format_presigned_url_response, cleanup_file_resources
 from utils.chunks import create_chunk_entries, process_etag_info, process_chunks, calculate_master_file_fingerprint
-from utils.folders import get_or_create_folder
+from utils.folders import get_or_create_folder, create_folders_bulk
 from utils.s3 import generate_and_store_presigned_urls, complete_multipart_upload_process, generate_download_urls
-from utils.db import get_file_metadata, get_chunks_for_file
+from utils.db import get_file_metadata, get_file_chunk_size, get_chunks_for_file
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +135,19 @@ async def create_folder(folder_request: FolderRequest):
             raise e
         raise HTTPException(status_code=500, detail=f"Failed to create/update folder: {str(e)}")
 
+@router.post("/folders/bulk", response_model=BulkFolderResponse)
+async def create_folders(bulk_request: BulkFolderRequest):
+    """
+    Create or update many folders in the database in one request
+    """
+    try:
+        return create_folders_bulk(bulk_request.folders)
+    except Exception as e:
+        logger.error(f"Error creating/updating folders: {str(e)}")
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(status_code=500, detail=f"Failed to create/update folders: {str(e)}")
+
 @router.post("/files/download", response_model=DownloadResponse)
 async def download_chunks(download_request: DownloadRequest):
     """
@@ -221,7 +234,7 @@ async def download_chunks(download_request: DownloadRequest):
 
         # Generate presigned URLs for valid chunks
         part_numbers = [chunk["part_number"] for chunk in valid_chunks]
-        download_url_data = generate_download_urls(file_id, part_numbers)
+        download_url_data = generate_download_urls(file_id, part_numbers, get_file_chunk_size(file_id))
 
         # Map the download URLs to the valid chunks
         download_urls = []
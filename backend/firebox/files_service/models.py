@@ -21,6 +21,7 @@ class FilesMetaData(Model):
     upload_id = UnicodeAttribute(null=True)  # Store the multipart upload ID
     complete_etag = UnicodeAttribute(null=True)  # Store the ETag of the completed file
     master_file_fingerprint = UnicodeAttribute(null=True)  # SHA256 hash of all chunk fingerprints
+    chunk_size = NumberAttribute(null=True)  # Size of every uploaded part but the last (default: CHUNK_SIZE)
 
     def __repr__(self):
         return f"<FilesMetaData(file_id='{self.file_id}', file_path='{self.file_path}', file_name='{self.file_name}', file_type='{self.file_type}')>"
@@ -12,6 +12,7 @@ class FileMetaRequest(BaseModel):
     folder_id: str
     chunk_count: int
     file_hash: Optional[str] = None
+    chunk_size: Optional[int] = None  # Bytes per part; all parts but the last have this size
 
     model_config = {
         "extra": "ignore"
@@ -122,6 +123,27 @@ class FolderResponse(BaseModel):
         "extra": "ignore"
     }
 
+class BulkFolderRequest(BaseModel):
+    """
+    Request model for creating/updating many folders at once
+    """
+    folders: List[FolderRequest]
+
+    model_config = {
+        "extra": "ignore"
+    }
+
+class BulkFolderResponse(BaseModel):
+    """
+    Response model for bulk folder creation/update
+    """
+    folder_ids: List[str]
+    success: bool
+
+    model_config = {
+        "extra": "ignore"
+    }
+
 class DownloadChunkInfo(BaseModel):
     """
     Model for chunk download information
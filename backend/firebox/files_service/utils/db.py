@@ -4,6 +4,7 @@ Database-related helper functions for the Files Service.
 from fastapi import HTTPException
 import logging
 
+import config
 from models import FilesMetaData, Chunks, Folders
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,14 @@ def get_file_metadata(file_id):
             raise e
         raise HTTPException(status_code=404, detail=f"File with ID {file_id} not found")
 
+def get_file_chunk_size(file_id):
+    """Get the part size a file was uploaded with, falling back to the default CHUNK_SIZE"""
+    try:
+        file_metadata = FilesMetaData.get(file_id)
+    except FilesMetaData.DoesNotExist:
+        return config.CHUNK_SIZE
+    return int(file_metadata.chunk_size or config.CHUNK_SIZE)
+
 def get_chunks_for_file(file_id):
     """Get all chunks for a file"""
     try:
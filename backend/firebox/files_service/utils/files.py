@@ -20,7 +20,8 @@ def create_file_metadata(file_id, file_meta):
             file_path=file_meta.file_path,
             file_name=file_meta.file_name,
             folder_id=file_meta.folder_id,
-            file_hash=file_meta.file_hash
+            file_hash=file_meta.file_hash,
+            chunk_size=file_meta.chunk_size
         )
         file_metadata.save()
         return file_metadata
@@ -45,3 +45,24 @@ def get_or_create_folder(folder_id, folder_request):
     except Exception as e:
         logger.error(f"Error creating/updating folder: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to create/update folder: {str(e)}")
+
+def create_folders_bulk(folder_requests):
+    """Create or overwrite many folders with batched DynamoDB writes"""
+    try:
+        with Folders.batch_write() as batch:
+            for folder_request in folder_requests:
+                batch.save(Folders(
+                    folder_id=folder_request.folder_id,
+                    folder_path=folder_request.folder_path,
+                    folder_name=folder_request.folder_name,
+                    parent_folder_id=folder_request.parent_folder_id
+                ))
+
+        logger.info(f"Created/updated {len(folder_requests)} folders")
+        return {
+            "folder_ids": [folder_request.folder_id for folder_request in folder_requests],
+            "success": True
+        }
+    except Exception as e:
+        logger.error(f"Error creating/updating folders: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to create/update folders: {str(e)}")
@@ -27,6 +27,32 @@ APP_DIR = os.environ.get("APP_DIR", "/app")
 # Chunk size (5MB)
 CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE", 5 * 1024 * 1024))
 
+# Files of at least LARGE_FILE_SIZE use bigger chunks, aiming for about TARGET_CHUNK_COUNT
+# parts of LARGE_CHUNK_SIZE to MAX_CHUNK_SIZE bytes (S3 allows at most 10,000 parts)
+LARGE_FILE_SIZE = int(os.environ.get("LARGE_FILE_SIZE", 1024 * 1024 * 1024))
+LARGE_CHUNK_SIZE = int(os.environ.get("LARGE_CHUNK_SIZE", 16 * 1024 * 1024))
+MAX_CHUNK_SIZE = int(os.environ.get("MAX_CHUNK_SIZE", 64 * 1024 * 1024))
+TARGET_CHUNK_COUNT = int(os.environ.get("TARGET_CHUNK_COUNT", 1000))
+
+# Number of recent whole-file hashes kept in memory, keyed by inode, mtime and size
+FILE_HASH_CACHE_SIZE = int(os.environ.get("FILE_HASH_CACHE_SIZE", 4096))
+
+# Number of chunk uploads in flight at once per file
+UPLOAD_CONCURRENCY = int(os.environ.get("UPLOAD_CONCURRENCY", 8))
+
+# Number of chunk downloads in flight at once per file
+DOWNLOAD_CONCURRENCY = int(os.environ.get("DOWNLOAD_CONCURRENCY", 8))
+
+# Nice value for the watcher's scan, event and chunk threads on Linux (0 leaves them alone);
+# their I/O priority follows it under the CFQ/BFQ schedulers
+WATCHER_NICE = int(os.environ.get("WATCHER_NICE", 19))
+
+# Number of files chunked and uploaded at once when a directory tree is moved in
+WATCHER_FILE_CONCURRENCY = int(os.environ.get("WATCHER_FILE_CONCURRENCY", 4))
+
+# Quiet period before a file's create/modify events are applied, so one save uploads once
+WATCHER_DEBOUNCE_SECONDS = float(os.environ.get("WATCHER_DEBOUNCE_SECONDS", 0.25))
+
 # API settings
 API_HOST = os.environ.get("API_HOST", "0.0.0.0")
 API_PORT = int(os.environ.get("API_PORT", 8000))
@@ -35,3 +61,9 @@ API_PORT = int(os.environ.get("API_PORT", 8000))
 FILES_SERVICE_URL = os.environ.get("FILES_SERVICE_URL", "http://files-service:8001")
 REQUEST_TIMEOUT = int(os.environ.get("REQUEST_TIMEOUT", 30))
 MAX_RETRIES = int(os.environ.get("MAX_RETRIES", 3))
+# Keep-alive connections kept per host; should cover the parallel chunk uploads
+HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", 4))
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 16))
+# Connection-level retries for idempotent chunk transfers (GET/PUT on presigned URLs)
+HTTP_RETRIES = int(os.environ.get("HTTP_RETRIES", 3))
+HTTP_RETRY_BACKOFF = float(os.environ.get("HTTP_RETRY_BACKOFF", 0.2))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, PrimaryKeyConstraint, String, ForeignKey, DateTime, Integer, Boolean, CheckConstraint
+from sqlalchemy import Column, PrimaryKeyConstraint, String, ForeignKey, DateTime, Integer, BigInteger, Boolean, CheckConstraint, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -9,9 +9,9 @@ class Folders(Base):
     __tablename__ = 'folders'
 
     folder_id = Column(String, primary_key=True)
-    folder_path = Column(String, nullable=False, unique=True)  # Full path to the folder
+    folder_path = Column(String, nullable=False, unique=True, index=True)  # Full path to the folder
     folder_name = Column(String, nullable=False)  # Just the folder name
-    parent_folder_id = Column(String, ForeignKey('folders.folder_id'), nullable=True)  # Parent folder ID (null for root)
+    parent_folder_id = Column(String, ForeignKey('folders.folder_id'), nullable=True, index=True)  # Parent folder ID (null for root)
 
     # Relationships
     files = relationship("FilesMetaData", back_populates="folder", cascade="all, delete-orphan")
@@ -29,10 +29,12 @@ class FilesMetaData(Base):
 
     file_id = Column(String, primary_key=True)
     file_type = Column(String, nullable=False)
-    file_path = Column(String, nullable=False, unique=True)  # Full path to the file
+    file_path = Column(String, nullable=False, unique=True, index=True)  # Full path to the file
     file_name = Column(String, nullable=False)   # Just the filename
-    file_hash = Column(String, nullable=True)    # Hash for deduplication
-    folder_id = Column(String, ForeignKey('folders.folder_id'), nullable=False)  # Folder containing this file
+    file_hash = Column(LargeBinary(32), nullable=True)    # Raw SHA-256 or BLAKE3 digest for deduplication
+    mtime_ns = Column(BigInteger, nullable=True)  # Modification time (ns) when file_hash was computed
+    file_size = Column(BigInteger, nullable=True)  # Size in bytes when file_hash was computed
+    folder_id = Column(String, ForeignKey('folders.folder_id'), nullable=False, index=True)  # Folder containing this file
     # master_file_fingerprint removed as it's no longer needed
 
     # Relationships
@@ -47,17 +49,23 @@ class Chunks(Base):
 
     chunk_id = Column(String, nullable=False)
     file_id = Column(String, ForeignKey('files_metadata.file_id'), nullable=False)
-    __table_args__ = (PrimaryKeyConstraint('chunk_id', 'file_id'),)
+    __table_args__ = (
+        PrimaryKeyConstraint('chunk_id', 'file_id'),
+        # Chunks are looked up per file and read back in part order
+        Index('ix_chunks_file_part', 'file_id', 'part_number'),
+    )
     part_number = Column(Integer, nullable=True)  # Part number for multipart upload
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     last_synced = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    fingerprint = Column(String, nullable=False)
+    fingerprint = Column(LargeBinary(32), nullable=False)  # Raw SHA-256 digest of the chunk
+    chunk_offset = Column(BigInteger, nullable=True)  # Byte offset of the chunk in the file's packed chunk file
+    chunk_length = Column(Integer, nullable=True)  # Length of the chunk in bytes
 
     # Relationship with FilesMetaData
     file = relationship("FilesMetaData", back_populates="chunks")
 
     def __repr__(self):
-        return f"<Chunks(chunk_id='{self.chunk_id}', file_id='{self.file_id}', part_number='{self.part_number}', created_at='{self.created_at}', last_synced='{self.last_synced}', fingerprint='{self.fingerprint}')>"
+        return f"<Chunks(chunk_id='{self.chunk_id}', file_id='{self.file_id}', part_number='{self.part_number}', created_at='{self.created_at}', last_synced='{self.last_synced}', fingerprint='{self.fingerprint.hex() if self.fingerprint else None}')>"
 
 
 class System(Base):
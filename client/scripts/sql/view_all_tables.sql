@@ -23,7 +23,7 @@ SELECT
     file_name AS "File Name",
     file_type AS "File Type",
     folder_id AS "Folder ID",
-    substr(file_hash, 1, 10) || '...' AS "File Hash"
+    substr(lower(hex(file_hash)), 1, 10) || '...' AS "File Hash"
 FROM
     files_metadata
 LIMIT 10;
@@ -74,7 +74,7 @@ SELECT
     file_id AS "File ID",
     datetime(created_at) AS "Created At",
     datetime(last_synced) AS "Last Synced",
-    fingerprint AS "Fingerprint"
+    lower(hex(fingerprint)) AS "Fingerprint"
 FROM
     chunks
 UNION ALL
@@ -5,7 +5,7 @@ from db.models import FilesMetaData, Chunks, Folders, System
 from typing import List, Dict, Any
 from datetime import datetime, timezone
 from server.schema import FileMetadata, ChunkMetadata, FolderMetadata, SystemInfo, SyncResponse
-from server.client import FileServiceClient
+from server.client import get_file_service_client
 from server.sync import SyncEngine
 
 router = APIRouter()
@@ -48,7 +48,7 @@ def get_files(db: Session = Depends(get_db)):
             file_path=file.file_path,
             file_name=file.file_name,
             file_type=file.file_type,
-            file_hash=file.file_hash
+            file_hash=file.file_hash.hex() if file.file_hash else None
         )
         for file in files
     ]
@@ -65,7 +65,7 @@ def get_file(file_id: str, db: Session = Depends(get_db)):
         file_path=file.file_path,
         file_name=file.file_name,
         file_type=file.file_type,
-        file_hash=file.file_hash
+        file_hash=file.file_hash.hex() if file.file_hash else None
     )
 
 @router.get("/chunks/{file_id}", response_model=List[ChunkMetadata])
@@ -78,7 +78,7 @@ def get_chunks(file_id: str, db: Session = Depends(get_db)):
             file_id=chunk.file_id,
             created_at=chunk.created_at,
             last_synced=chunk.last_synced,
-            fingerprint=chunk.fingerprint
+            fingerprint=chunk.fingerprint.hex()
         )
         for chunk in chunks
     ]
@@ -116,15 +116,15 @@ def sync_with_server(db: Session = Depends(get_db)):
         # If no last sync time, use a default (e.g., epoch)
         last_sync_time = "1970-01-01T00:00:00+00:00"
 
-    # Create a client to call the server
-    client = FileServiceClient()
+    # Reuse the process-wide client (and its connection pool) to call the server
+    client = get_file_service_client()
 
     try:
         # Call the server sync endpoint
         response = client.sync(last_sync_time)
 
         # Process the sync response using the SyncEngine
-        sync_engine = SyncEngine(db)
+        sync_engine = SyncEngine(db, api_client=client)
         success = sync_engine.process_sync_response(response)
 
         if not success:
@@ -1,6 +1,60 @@
 import hashlib
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Generator, Tuple
-from config import CHUNK_SIZE
+from config import CHUNK_SIZE, LARGE_FILE_SIZE, LARGE_CHUNK_SIZE, MAX_CHUNK_SIZE, TARGET_CHUNK_COUNT
+
+logger = logging.getLogger(__name__)
+
+# Number of independent chunk buffers fingerprinted together by batch_fingerprints
+HASH_LANES = 8
+
+# hashlib releases the GIL while digesting large buffers, so lanes hash in parallel
+_hash_pool = ThreadPoolExecutor(max_workers=HASH_LANES, thread_name_prefix="chunk-hash")
+
+def choose_chunk_size(file_size: int) -> int:
+    """
+    Pick the chunk size for a file, using bigger chunks for large files
+
+    Args:
+        file_size: Size of the file in bytes
+
+    Returns:
+        int: Chunk size in bytes
+    """
+    if file_size < LARGE_FILE_SIZE:
+        return CHUNK_SIZE
+    return min(max(file_size // TARGET_CHUNK_COUNT, LARGE_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+def _fingerprint(buffer) -> bytes:
+    """Raw SHA-256 fingerprint of one chunk buffer"""
+    return hashlib.sha256(buffer).digest()
+
+def submit_fingerprints(buffers) -> List[Future]:
+    """
+    Start fingerprinting a group of independent chunk buffers on the hash lanes
+
+    Args:
+        buffers: Up to HASH_LANES bytes-like chunk buffers
+
+    Returns:
+        List[Future]: Future for the raw SHA-256 fingerprint of each buffer, in the same order
+    """
+    return [_hash_pool.submit(_fingerprint, buf) for buf in buffers]
+
+def batch_fingerprints(buffers) -> List[bytes]:
+    """
+    Calculate fingerprints for a group of independent chunk buffers
+
+    Args:
+        buffers: Up to HASH_LANES bytes-like chunk buffers
+
+    Returns:
+        List[bytes]: Raw SHA-256 fingerprint of each buffer, in the same order
+    """
+    if len(buffers) == 1:
+        return [_fingerprint(buffers[0])]
+    return [lane.result() for lane in submit_fingerprints(buffers)]
 
 class Chunker:
     def __init__(self, chunk_size: int = CHUNK_SIZE):
@@ -12,7 +66,7 @@ class Chunker:
         """
         self.chunk_size = chunk_size
 
-    def split_file(self, file_path: str) -> Generator[Tuple[bytes, str], None, None]:
+    def split_file(self, file_path: str) -> Generator[Tuple[bytes, bytes], None, None]:
         """
         Split a file into chunks
 
@@ -29,7 +83,7 @@ class Chunker:
                     break
 
                 # Calculate fingerprint (hash) of chunk
-                fingerprint = hashlib.sha256(chunk_data).hexdigest()
+                fingerprint = hashlib.sha256(chunk_data).digest()
 
                 yield (chunk_data, fingerprint)
 
@@ -50,10 +104,10 @@ class Chunker:
                     f.write(chunk)
             return True
         except Exception as e:
-            print(f"Error merging chunks: {e}")
+            logger.error("Error merging chunks: %s", e)
             return False
 
-    def calculate_fingerprint(self, data: bytes) -> str:
+    def calculate_fingerprint(self, data: bytes) -> bytes:
         """
         Calculate fingerprint (hash) of data
 
@@ -61,6 +115,6 @@ class Chunker:
             data: Data to calculate fingerprint for
 
         Returns:
-            str: Fingerprint of data
+            bytes: Raw SHA-256 fingerprint of data
         """
-        return hashlib.sha256(data).hexdigest()
+        return hashlib.sha256(data).digest()
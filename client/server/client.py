@@ -1,12 +1,20 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import logging
+import threading
 from typing import List, Dict, Optional, Tuple
-from config import FILES_SERVICE_URL, REQUEST_TIMEOUT, MAX_RETRIES
+from config import (
+    FILES_SERVICE_URL, REQUEST_TIMEOUT, MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_RETRIES, HTTP_RETRY_BACKOFF
+)
 import time
 from server.schema import (
     FileMetaRequest, FileMetaResponse, ChunkETagInfo,
     ChunkConfirmRequest, ChunkConfirmResponse, FolderRequest, FolderResponse,
+    BulkFolderRequest, BulkFolderResponse,
+    DownloadChunkInfo, DownloadRequest, DownloadResponse,
     SyncRequest, SyncResponse
 )
 
@@ -32,6 +40,19 @@ class FileServiceClient:
         self.max_retries = max_retries
         self.session = requests.Session()
 
+        # Pool keep-alive connections so API calls and parallel chunk transfers reuse them.
+        # Only idempotent requests are retried here; API POSTs retry in _make_request
+        retry = Retry(
+            total=HTTP_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "PUT"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
                      files: Optional[Dict] = None, retry_count: int = 0) -> Dict:
         """
@@ -71,7 +92,8 @@ class FileServiceClient:
                 raise
 
     def create_file(self, file_id: str, file_name: str, file_path: str, file_type: str,
-                   folder_id: str, chunk_count: int, file_hash: str) -> FileMetaResponse:
+                   folder_id: str, chunk_count: int, file_hash: str,
+                   chunk_size: Optional[int] = None) -> FileMetaResponse:
         """
         Create a file in the Files Service and get presigned URLs for uploading chunks
 
@@ -83,6 +105,7 @@ class FileServiceClient:
             folder_id: ID of the folder containing the file
             chunk_count: Number of chunks
             file_hash: Hash of the file
+            chunk_size: Size of every chunk but the last, in bytes (optional)
 
         Returns:
             FileMetaResponse: Response containing file_id and presigned_urls
@@ -95,7 +118,8 @@ class FileServiceClient:
             file_type=file_type,
             folder_id=folder_id,
             chunk_count=chunk_count,
-            file_hash=file_hash
+            file_hash=file_hash,
+            chunk_size=chunk_size
         )
 
         # Convert to dict for the API request
@@ -118,25 +142,18 @@ class FileServiceClient:
         """
         try:
             # Presigned URLs require a direct PUT request, not through our _make_request method
-            response = requests.put(presigned_url, data=chunk_data, timeout=self.timeout)
+            response = self.session.put(presigned_url, data=chunk_data, timeout=self.timeout)
             response.raise_for_status()
 
             # Extract the ETag from the response headers
             etag = response.headers.get('ETag')
             if etag:
-                # Log the raw ETag for debugging
-                print(f"DEBUG: Raw ETag from S3/MinIO: '{etag}'")
-                logger.info(f"DEBUG: Raw ETag from S3/MinIO: '{etag}'")
-
                 # S3/MinIO typically returns ETags with quotes, which we should preserve
                 # Just remove any extra whitespace
                 etag = etag.strip()
 
-                # Log the processed ETag
-                print(f"DEBUG: Processed ETag: '{etag}'")
-                logger.info(f"DEBUG: Processed ETag: '{etag}'")
-
-                logger.info(f"Chunk uploaded successfully with ETag: {etag}")
+                # Runs once per chunk, so only at debug level
+                logger.debug("Chunk uploaded successfully with ETag: %s", etag)
                 return True, etag
             else:
                 logger.warning("Chunk uploaded but no ETag was returned")
@@ -172,6 +189,26 @@ class FileServiceClient:
         logger.info(f"Creating/updating folder {folder_name} with ID {folder_id}")
         return self._make_request("POST", "/folders", data)
 
+    def create_folders_bulk(self, folders: List[Dict]) -> BulkFolderResponse:
+        """
+        Create or update many folders in the Files Service with one request
+
+        Args:
+            folders: List of dicts with folder_id, folder_path, folder_name and parent_folder_id
+
+        Returns:
+            BulkFolderResponse: Response data
+        """
+        bulk_request = BulkFolderRequest(
+            folders=[FolderRequest(**folder) for folder in folders]
+        )
+
+        # Convert to dict for the API request
+        data = bulk_request.model_dump()
+
+        logger.info(f"Creating/updating {len(folders)} folders")
+        return self._make_request("POST", "/folders/bulk", data)
+
     def update_file(self, file_id: str, file_name: str, file_path: str, folder_id: str) -> Dict:
         """
         Update file metadata in the Files Service
@@ -234,9 +271,6 @@ class FileServiceClient:
         # Extract just the chunk IDs for backward compatibility
         chunk_ids = [chunk['chunk_id'] for chunk in chunk_data]
 
-        # Print detailed information about the chunk data
-        print(f"Confirming upload for file {file_id} with {len(chunk_ids)} chunks")
-
         # Create a copy of chunk_data to avoid modifying the original
         processed_chunk_data = []
 
@@ -254,18 +288,17 @@ class FileServiceClient:
             # Handle ETag quotes - S3 returns ETags with quotes, and we need to preserve them
             # for the CompleteMultipartUpload call
             if 'etag' in processed_chunk:
-                # Log the raw ETag
-                print(f"DEBUG: Raw ETag for chunk {processed_chunk['chunk_id']}: '{processed_chunk['etag']}'")
-
                 # Ensure the ETag has quotes (S3 expects them)
                 etag_value = processed_chunk['etag']
                 if not (etag_value.startswith('"') and etag_value.endswith('"')):
                     etag_value = etag_value.strip('"')
                     etag_value = f'"{etag_value}"'
                     processed_chunk['etag'] = etag_value
-                    print(f"DEBUG: Added quotes to ETag: '{etag_value}'")
 
-            print(f"  Chunk {i+1}: chunk_id={processed_chunk['chunk_id']}, part_number={processed_chunk['part_number']}, etag={processed_chunk['etag']}, fingerprint={processed_chunk['fingerprint']}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Chunk %s: chunk_id=%s, part_number=%s, etag=%s, fingerprint=%s",
+                             i + 1, processed_chunk['chunk_id'], processed_chunk['part_number'],
+                             processed_chunk.get('etag'), processed_chunk['fingerprint'])
             processed_chunk_data.append(processed_chunk)
 
         # Create a ChunkConfirmRequest object
@@ -278,16 +311,36 @@ class FileServiceClient:
         # Convert to dict for the API request
         data = chunk_confirm_request.model_dump()
 
-        logger.info(f"Confirming upload for file {file_id} with {len(chunk_ids)} chunks")
-        logger.info(f"Full confirmation data: {data}")
+        logger.info("Confirming upload for file %s with %s chunks", file_id, len(chunk_ids))
+        logger.debug("Full confirmation data: %s", data)
 
         # Make the request
-        print(f"Sending confirmation request to /files/confirm with data: {data}")
         response = self._make_request("POST", "/files/confirm", data)
-        print(f"Confirmation response: {response}")
-        logger.info(f"Confirmation response: {response}")
+        logger.debug("Confirmation response: %s", response)
         return response
 
+    def get_download_urls(self, file_id: str, chunks: List[Dict]) -> DownloadResponse:
+        """
+        Get presigned download URLs for many chunks of a file with one request
+
+        Args:
+            file_id: ID of the file
+            chunks: List of dicts with chunk_id, part_number and fingerprint for each chunk
+
+        Returns:
+            DownloadResponse: Response data with one download URL per chunk
+        """
+        download_request = DownloadRequest(
+            file_id=file_id,
+            chunks=[DownloadChunkInfo(**chunk) for chunk in chunks]
+        )
+
+        # Convert to dict for the API request
+        data = download_request.model_dump()
+
+        logger.info(f"Requesting download URLs for {len(chunks)} chunks of file {file_id}")
+        return self._make_request("POST", "/files/download", data)
+
     def sync(self, last_sync_time: str) -> SyncResponse:
         """
         Sync with the server to get updates since the last sync time
@@ -313,3 +366,22 @@ class FileServiceClient:
         logger.info(f"Sync response: {len(response.get('updated_files', []))} updated files")
 
         return response
+
+
+# One client per process so the watcher, the sync endpoint and every SyncEngine share
+# the same keep-alive connection pool
+_shared_client: Optional[FileServiceClient] = None
+_shared_client_lock = threading.Lock()
+
+def get_file_service_client() -> FileServiceClient:
+    """
+    Get the process-wide Files Service client, creating it on first use
+
+    Returns:
+        FileServiceClient: Shared client instance
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = FileServiceClient()
+        return _shared_client
@@ -1,5 +1,7 @@
 from fastapi import FastAPI
 import os
+import ssl
+import hashlib
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
@@ -39,6 +41,9 @@ os.makedirs(CHUNK_DIR, exist_ok=True)
 print(f"Sync directory: {SYNC_DIR} (exists: {os.path.exists(SYNC_DIR)}, writable: {os.access(SYNC_DIR, os.W_OK)})")
 print(f"Chunk directory: {CHUNK_DIR} (exists: {os.path.exists(CHUNK_DIR)}, writable: {os.access(CHUNK_DIR, os.W_OK)})")
 
+# Report the OpenSSL build backing hashlib (1.1.1+ dispatches SHA-256 to SHA-NI where the CPU supports it)
+print(f"Hashing backend: {ssl.OPENSSL_VERSION} (sha256 from OpenSSL: {hashlib.sha256.__module__ == '_hashlib'})")
+
 # Create a test file in the chunk directory to verify it's working
 test_file_path = os.path.join(CHUNK_DIR, "test_file.txt")
 try:
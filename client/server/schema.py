@@ -13,6 +13,7 @@ class FileMetaRequest(BaseModel):
     folder_id: str
     chunk_count: int
     file_hash: Optional[str] = None
+    chunk_size: Optional[int] = None  # Bytes per part; all parts but the last have this size
 
     model_config = {
         "extra": "ignore"
@@ -123,6 +124,27 @@ class FolderResponse(BaseModel):
         "extra": "ignore"
     }
 
+class BulkFolderRequest(BaseModel):
+    """
+    Request model for creating/updating many folders at once
+    """
+    folders: List[FolderRequest]
+
+    model_config = {
+        "extra": "ignore"
+    }
+
+class BulkFolderResponse(BaseModel):
+    """
+    Response model for bulk folder creation/update
+    """
+    folder_ids: List[str]
+    success: bool
+
+    model_config = {
+        "extra": "ignore"
+    }
+
 # Additional client-specific models
 
 class FileMetadata(BaseModel):
@@ -191,6 +213,46 @@ class DownloadChunkInfo(BaseModel):
         "extra": "ignore"
     }
 
+class DownloadRequest(BaseModel):
+    """
+    Request model for downloading chunks
+    """
+    file_id: str
+    chunks: List[DownloadChunkInfo]
+
+    model_config = {
+        "extra": "ignore"
+    }
+
+class DownloadUrlResponse(BaseModel):
+    """
+    Response model for a download URL
+    """
+    chunk_id: str
+    part_number: int
+    fingerprint: str
+    presigned_url: str
+    start_byte: Optional[int] = None
+    end_byte: Optional[int] = None
+    range_header: Optional[str] = None
+
+    model_config = {
+        "extra": "ignore"
+    }
+
+class DownloadResponse(BaseModel):
+    """
+    Response model for download request
+    """
+    file_id: str
+    download_urls: List[DownloadUrlResponse]
+    success: bool
+    error_message: Optional[str] = None
+
+    model_config = {
+        "extra": "ignore"
+    }
+
 class SyncRequest(BaseModel):
     """
     Request model for sync endpoint
@@ -1,38 +1,244 @@
+from sqlalchemy import and_, func, insert, literal, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from db.models import FilesMetaData, Chunks, Folders, System
 from datetime import datetime, timezone
 import os
+import sys
 import uuid
 import hashlib
-from config import CHUNK_DIR, SYNC_DIR, CHUNK_SIZE
-from typing import Optional
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import PurePosixPath
+from config import CHUNK_DIR, SYNC_DIR, FILE_HASH_CACHE_SIZE, UPLOAD_CONCURRENCY, DOWNLOAD_CONCURRENCY
+from server.chunker import HASH_LANES, batch_fingerprints, choose_chunk_size, submit_fingerprints
+from server.client import FileServiceClient, get_file_service_client
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+logger = logging.getLogger(__name__)
+
+# Whole-file hashes use BLAKE3 when the optional blake3 package is installed and SHA-256
+# otherwise; chunk fingerprints stay SHA-256 for the server's chunk verification
+FILE_HASH_ALGORITHM = 'b3' if blake3 is not None else 'sha256'
+
+# Whole files are hashed in blocks of HASH_READ_BUFFER_SIZE bytes
+HASH_READ_BUFFER_SIZE = 1024 * 1024
+
+# Recently computed file hashes keyed by (st_dev, st_ino, st_mtime_ns, st_size), shared by
+# every engine so repeated events for an unchanged file don't read it again
+_file_hash_cache: "OrderedDict[Tuple[int, int, int, int], bytes]" = OrderedDict()
+_file_hash_cache_lock = threading.Lock()
+
+# Worker threads that stat and hash files during a directory scan
+SCAN_WORKERS = os.cpu_count() or 4
+
+# Number of on-disk packed chunk file IDs checked per query when looking for orphans
+ORPHAN_SCAN_BATCH_SIZE = 1000
+
+# os.sendfile can target regular files only on Linux; elsewhere fall back to buffered reads
+USE_SENDFILE = sys.platform.startswith('linux')
+
+# Packed chunk files mirror their source file's layout, so chunks can be copied in the kernel
+USE_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Chunks hashed in the fused hash pass are read straight into reused buffers
+USE_PREADV = hasattr(os, 'preadv')
+
+# Read-ahead hints for packed chunk files that are reassembled front to back
+USE_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Number of file paths looked up per query when applying a sync response
+SYNC_LOOKUP_BATCH_SIZE = 500
+
+# Bytes read from the network per write while streaming a chunk download to disk
+DOWNLOAD_BUFFER_SIZE = 64 * 1024
+
+def split_file_path(file_path: str) -> Tuple[str, str, str]:
+    """
+    Split a normalized file path into its parent directory, file name and file type
+
+    One pass over the path instead of separate dirname, basename and splitext calls; the
+    file type follows splitext, so leading dots of a name don't start an extension.
+
+    Args:
+        file_path: Normalized path of the file
+
+    Returns:
+        Tuple[str, str, str]: Parent directory, file name and file type ("unknown" if the
+        name has no extension)
+    """
+    parent_path, _, file_name = file_path.rpartition('/')
+    if not parent_path and file_path.startswith('/'):
+        parent_path = '/'
+    stem = file_name.lstrip('.')
+    dot = stem.rfind('.')
+    file_type = stem[dot + 1:] if dot != -1 else "unknown"
+    return parent_path, file_name, file_type
+
+# Random bytes drawn from the OS per refill of the ID pool, enough for 256 UUIDs
+UUID_POOL_SIZE = 4096
+_uuid_pool = memoryview(b'')
+_uuid_pool_lock = threading.Lock()
+
+def new_id() -> str:
+    """
+    Generate a random (version 4) UUID string for a new file or folder row
+
+    IDs are cut from a pool of random bytes so that adding thousands of rows doesn't
+    ask the OS for randomness once per row.
+
+    Returns:
+        str: UUID in its canonical string form
+    """
+    global _uuid_pool
+    with _uuid_pool_lock:
+        if len(_uuid_pool) < 16:
+            _uuid_pool = memoryview(os.urandom(UUID_POOL_SIZE))
+        id_bytes = _uuid_pool[:16].tobytes()
+        _uuid_pool = _uuid_pool[16:]
+    return str(uuid.UUID(bytes=id_bytes, version=4))
+
+def format_file_hash(file_hash: Optional[bytes]) -> Optional[str]:
+    """
+    Encode a raw file hash for the server, prefixed with its algorithm (e.g. "b3:..." or "sha256:...")
+
+    Args:
+        file_hash: Raw digest returned by calculate_file_hash
+
+    Returns:
+        Optional[str]: Algorithm-prefixed hex digest, or None if there is no hash
+    """
+    if not file_hash:
+        return None
+    return f"{FILE_HASH_ALGORITHM}:{file_hash.hex()}"
+
+def subtree_filter(path_column, base_path: str):
+    """
+    Build a filter matching every path strictly below base_path
+
+    Unlike LIKE 'base/%', the equivalent range can be answered from an index on the path column.
+
+    Args:
+        path_column: Path column to filter on (e.g. Folders.folder_path)
+        base_path: Folder path whose descendants should match
+
+    Returns:
+        SQL expression selecting the descendant paths
+    """
+    return and_(path_column >= base_path + os.sep, path_column < base_path + chr(ord(os.sep) + 1))
 
 class SyncEngine:
-    def __init__(self, db: Session, sync_dir: str = SYNC_DIR):
+    def __init__(self, db: Session, sync_dir: str = SYNC_DIR, api_client: Optional[FileServiceClient] = None):
         self.db = db
-        self.sync_dir = sync_dir
+        self.sync_dir = os.path.normpath(sync_dir)
+
+        # Paths inside the sync directory start with this; it also excludes the sync directory itself
+        self._sync_dir_prefix = self.sync_dir + os.sep
+
+        # One client (and its pooled HTTP session) for every call this engine makes;
+        # callers handling many events pass theirs in to keep connections alive across them
+        self.api_client = api_client or get_file_service_client()
+
+        # folder_path -> folder_id for folders known to be in the database
+        self._folder_cache: Dict[str, str] = {}
 
         # Ensure chunk directory exists
         os.makedirs(CHUNK_DIR, exist_ok=True)
 
-    def calculate_file_hash(self, file_path: str) -> str:
+    def calculate_file_hash(self, file_path: str, file_stat: Optional[os.stat_result] = None) -> bytes:
         """
         Calculate a hash for the entire file for deduplication purposes
 
         Args:
             file_path: Path to the file
+            file_stat: Stat of the file taken before hashing (optional)
 
         Returns:
-            str: Hash of the file
+            bytes: Raw 32-byte digest of the file (see FILE_HASH_ALGORITHM)
         """
-        hash_obj = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            # Read in chunks to handle large files efficiently
-            for chunk in iter(lambda: f.read(4096), b''):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+
+        # Same file, modification time and size as a recent hash: reuse it
+        file_hash = self._cached_file_hash(file_stat)
+        if file_hash is not None:
+            return file_hash
+
+        file_hash = self._digest_file(file_path)
+        self._remember_file_hash(file_stat, file_hash)
+        return file_hash
+
+    def _cached_file_hash(self, file_stat: os.stat_result) -> Optional[bytes]:
+        """
+        Look up a file's hash in the shared file hash cache without reading the file
+
+        Args:
+            file_stat: Current stat of the file
+
+        Returns:
+            Optional[bytes]: Raw digest of the file, or None if it isn't cached
+        """
+        cache_key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+        with _file_hash_cache_lock:
+            file_hash = _file_hash_cache.get(cache_key)
+            if file_hash is not None:
+                _file_hash_cache.move_to_end(cache_key)
+            return file_hash
+
+    def _remember_file_hash(self, file_stat: os.stat_result, file_hash: bytes):
+        """
+        Add a computed file hash to the shared file hash cache
 
-    def find_existing_file(self, file_path: str, file_hash: str = None) -> Optional[FilesMetaData]:
+        Args:
+            file_stat: Stat of the file taken before hashing
+            file_hash: Raw digest of the file
+        """
+        cache_key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+        with _file_hash_cache_lock:
+            _file_hash_cache[cache_key] = file_hash
+            _file_hash_cache.move_to_end(cache_key)
+            if len(_file_hash_cache) > FILE_HASH_CACHE_SIZE:
+                _file_hash_cache.popitem(last=False)
+
+    def _digest_file(self, file_path: str) -> bytes:
+        """
+        Read and hash the entire file
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            bytes: Raw 32-byte digest of the file (see FILE_HASH_ALGORITHM)
+        """
+        if blake3 is not None:
+            # BLAKE3 spreads each block over all cores
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            hasher = hashlib.sha256()
+
+        # Read large blocks into one reused buffer rather than mapping the file: touching a
+        # mapping of a file that another process has truncated raises SIGBUS, which would
+        # kill the whole client
+        buffer = bytearray(HASH_READ_BUFFER_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hasher.update(view[:size])
+        return hasher.digest()
+
+    def find_existing_file(self, file_path: str, file_hash: bytes = None) -> Optional[FilesMetaData]:
         """
         Check if a file with the same path already exists
 
@@ -52,44 +258,120 @@ class SyncEngine:
 
         return existing_file
 
-    def cleanup_orphaned_chunks(self):
+    def _packed_chunk_path(self, file_id: str) -> str:
         """
-        Clean up orphaned chunks that are no longer associated with any file
+        Get the path of the packed chunk file holding every local chunk of a file
+
+        Args:
+            file_id: ID of the file
+
+        Returns:
+            str: Path of the packed chunk file in the chunk directory
         """
-        print("Cleaning up orphaned chunks...")
+        return os.path.join(CHUNK_DIR, f"{file_id}.chunk")
 
-        # Get all chunk IDs from the database
-        db_chunks = self.db.query(Chunks.chunk_id).all()
-        db_chunk_ids = set([chunk[0] for chunk in db_chunks])
+    def _write_packed_chunk(self, file_id: str, chunk_offset: int, pieces) -> int:
+        """
+        Write a single chunk into a file's packed chunk file at its offset
 
-        # Get all chunk files from the chunk directory
-        chunk_files = []
-        if os.path.exists(CHUNK_DIR):
-            chunk_files = [f for f in os.listdir(CHUNK_DIR) if f.endswith('.chunk')]
+        Args:
+            file_id: ID of the file
+            chunk_offset: Byte offset of the chunk within the file
+            pieces: Iterable of bytes making up the chunk content, written in order
+
+        Returns:
+            int: Number of bytes written
+        """
+        written = 0
+        fd = os.open(self._packed_chunk_path(file_id), os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            for piece in pieces:
+                os.pwrite(fd, piece, chunk_offset + written)
+                written += len(piece)
+        finally:
+            os.close(fd)
+        return written
+
+    def remove_packed_chunk_files(self, file_ids: List[str]):
+        """
+        Delete the packed chunk files of files whose chunk rows were just deleted
+
+        Args:
+            file_ids: IDs of the deleted files
+        """
+        for file_id in file_ids:
+            chunk_path = self._packed_chunk_path(file_id)
+            try:
+                os.unlink(chunk_path)
+                logger.debug("Deleted packed chunk file: %s", chunk_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error("Error deleting packed chunk file %s: %s", chunk_path, e)
+
+    def cleanup_orphaned_chunks(self):
+        """
+        Clean up packed chunk files that are no longer associated with any file
+        """
+        logger.info("Cleaning up orphaned chunks...")
 
-        # Find orphaned chunk files (files that exist on disk but not in the database)
         orphaned_count = 0
-        for chunk_file in chunk_files:
-            chunk_id = chunk_file.replace('.chunk', '')
-            if chunk_id not in db_chunk_ids:
-                # This is an orphaned chunk, delete it
-                chunk_path = os.path.join(CHUNK_DIR, chunk_file)
-                try:
-                    os.remove(chunk_path)
-                    print(f"Deleted orphaned chunk: {chunk_path}")
-                    orphaned_count += 1
-                except Exception as e:
-                    print(f"Error deleting orphaned chunk {chunk_path}: {e}")
+        if not os.path.exists(CHUNK_DIR):
+            logger.info("Cleanup complete. Deleted %s orphaned chunks.", orphaned_count)
+            return
 
-        print(f"Cleanup complete. Deleted {orphaned_count} orphaned chunks.")
+        # Check the packed chunk files found on disk against the database one batch at a
+        # time so the set of tracked file IDs is never materialized in Python
+        batch = {}
+        with os.scandir(CHUNK_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.chunk') and entry.is_file():
+                    batch[entry.name[:-len('.chunk')]] = entry
+                    if len(batch) >= ORPHAN_SCAN_BATCH_SIZE:
+                        orphaned_count += self._delete_orphaned_chunk_files(batch)
+                        batch = {}
+        if batch:
+            orphaned_count += self._delete_orphaned_chunk_files(batch)
+
+        logger.info("Cleanup complete. Deleted %s orphaned chunks.", orphaned_count)
+
+    def _delete_orphaned_chunk_files(self, batch: Dict[str, os.DirEntry]) -> int:
+        """
+        Delete the packed chunk files in a batch whose file no longer has any chunks
 
-    def upload_file(self, file_path: str) -> str:
+        Args:
+            batch: Directory entries of packed chunk files, keyed by file ID
+
+        Returns:
+            int: Number of packed chunk files deleted
+        """
+        tracked_file_ids = set(self.db.execute(
+            select(Chunks.file_id).distinct().where(Chunks.file_id.in_(list(batch)))
+        ).scalars())
+
+        deleted_count = 0
+        for file_id, entry in batch.items():
+            if file_id in tracked_file_ids:
+                continue
+            # This is an orphaned packed chunk file, delete it
+            try:
+                os.unlink(entry.path)
+                logger.debug("Deleted orphaned chunk: %s", entry.path)
+                deleted_count += 1
+            except Exception as e:
+                logger.error("Error deleting orphaned chunk %s: %s", entry.path, e)
+        return deleted_count
+
+    def upload_file(self, file_path: str, file_stat: Optional[os.stat_result] = None,
+                    file_hash: Optional[bytes] = None) -> str:
         """
         Upload a file to the sync directory and create metadata
         If the file already exists at the same path, update it instead of creating a new entry
 
         Args:
             file_path: Path to the file to upload
+            file_stat: Stat of the file taken before file_hash was computed (optional)
+            file_hash: Hash of the file, if the caller already computed it (optional)
 
         Returns:
             file_id: ID of the uploaded file
@@ -97,69 +379,93 @@ class SyncEngine:
         # Normalize the file path to ensure consistent path format
         file_path = os.path.normpath(file_path)
 
-        # Extract file name and parent path
-        file_name = os.path.basename(file_path)
-        parent_path = os.path.dirname(file_path)
+        # Extract parent path, file name and file type
+        parent_path, file_name, file_type = split_file_path(file_path)
 
         # Ensure parent directory exists in the database and get its folder_id
         folder_id = self.ensure_parent_directories(parent_path)
 
-        # Calculate file hash for content tracking
-        file_hash = self.calculate_file_hash(file_path)
-
         # Check if file already exists at this exact path
-        existing_file = self.find_existing_file(file_path, file_hash)
+        existing_file = self.find_existing_file(file_path)
+
+        if file_stat is None:
+            # Stat before hashing so a write that races the hash shows up as a change next scan
+            file_stat = os.stat(file_path)
 
-        # Get file type from extension
-        _, file_extension = os.path.splitext(file_path)
-        file_type = file_extension[1:] if file_extension else "unknown"
+        if (file_hash is None and existing_file and existing_file.file_hash
+                and existing_file.mtime_ns == file_stat.st_mtime_ns
+                and existing_file.file_size == file_stat.st_size):
+            # Same mtime and size as when the stored hash was computed: content is unchanged
+            file_hash = existing_file.file_hash
+        # Otherwise a missing hash is computed by _process_file_chunks in the same pass that
+        # fingerprints the chunks, instead of reading the file once more up front
 
         if existing_file:
             # Update existing file at this path
-            print(f"File already exists at path {file_path} with ID: {existing_file.file_id}. Updating...")
+            logger.debug("File already exists at path %s with ID: %s. Updating...", file_path, existing_file.file_id)
             file_id = existing_file.file_id
 
             # Save the old hash for comparison
             old_hash = existing_file.file_hash
-
-            # Update metadata if needed
-            existing_file.file_type = file_type
-            existing_file.folder_id = folder_id
-            existing_file.file_name = file_name
-            existing_file.file_hash = file_hash
-            self.db.commit()
-
-            # Check if content has changed by comparing hash
-            if old_hash != file_hash:
-                print(f"File content has changed. Updating chunks...")
-                # Delete existing chunks only if content has changed
-                self.db.query(Chunks).filter(Chunks.file_id == file_id).delete()
-                self.db.commit()
-
-                # Process new file chunks
-                self._process_file_chunks(file_path, file_id)
-            else:
-                print(f"File content unchanged. Skipping chunk processing.")
         else:
             # Create new file metadata for this path
-            file_id = str(uuid.uuid4())
-
-            file_metadata = FilesMetaData(
-                file_id=file_id,
-                file_type=file_type,
-                file_path=file_path,
-                folder_id=folder_id,
-                file_name=file_name,
-                file_hash=file_hash
-            )
-            self.db.add(file_metadata)
+            file_id = new_id()
+            old_hash = None
+
+        # Columns of the file's row; nothing is written until the upload has finished, so the
+        # database isn't locked while the file is hashed and uploaded
+        file_values = {
+            'file_type': file_type,
+            'file_path': file_path,
+            'folder_id': folder_id,
+            'file_name': file_name,
+            'file_hash': file_hash,
+            'mtime_ns': file_stat.st_mtime_ns,
+            'file_size': file_stat.st_size
+        }
+
+        # Check if content has changed by comparing hash; without a hash yet the
+        # comparison happens once the chunk pass has hashed the file
+        if existing_file and file_hash is not None and old_hash == file_hash:
+            logger.debug("File content unchanged. Skipping chunk processing.")
+            self._write_file_row(existing_file, file_id, file_values)
             self.db.commit()
-
-            # Process file chunks for new file
-            self._process_file_chunks(file_path, file_id)
+        else:
+            logger.debug("File content may have changed. Updating chunks...")
+            self._process_file_chunks(file_path, file_id, previous_hash=old_hash, file_values=file_values)
 
         return file_id
 
+    def _write_file_row(self, file_metadata: Optional[FilesMetaData], file_id: str, file_values: Dict):
+        """
+        Add a file's row to the session, or update the row it already has
+
+        Args:
+            file_metadata: Current row of the file, or None if it has none yet
+            file_id: ID of the file
+            file_values: Columns to set on the row
+        """
+        if file_metadata is None:
+            self.db.add(FilesMetaData(file_id=file_id, **file_values))
+        else:
+            for column, value in file_values.items():
+                setattr(file_metadata, column, value)
+
+    def _update_last_sync_time(self):
+        """
+        Record the current time as system_last_sync_time in the System table
+        """
+        try:
+            system_record = self.db.query(System).filter(System.id == 1).first()
+            if system_record:
+                current_time = datetime.now(timezone.utc).isoformat()
+                system_record.system_last_sync_time = current_time
+                logger.info("Updated system_last_sync_time to %s", current_time)
+            else:
+                logger.warning("System record not found, cannot update system_last_sync_time")
+        except Exception as e:
+            logger.error("Error updating system_last_sync_time: %s", e)
+
     def find_existing_folder(self, folder_path: str) -> Optional[Folders]:
         """
         Check if a folder with the same path already exists
@@ -176,6 +482,62 @@ class SyncEngine:
 
         return existing_folder
 
+    def _load_folder_cache(self):
+        """
+        Load the folder_path -> folder_id mapping for every tracked folder in one query
+        """
+        self._folder_cache = dict(self.db.query(Folders.folder_path, Folders.folder_id).all())
+
+    def _find_folder_id(self, folder_path: str) -> Optional[str]:
+        """
+        Look up a folder's ID, consulting the folder cache before the database
+
+        Args:
+            folder_path: Path to the folder
+
+        Returns:
+            Optional[str]: Folder ID if the folder is tracked, None otherwise
+        """
+        folder_id = self._folder_cache.get(folder_path)
+        if folder_id is None:
+            existing_folder = self.find_existing_folder(folder_path)
+            if existing_folder:
+                folder_id = existing_folder.folder_id
+                self._folder_cache[folder_path] = folder_id
+        return folder_id
+
+    def _cache_folder_ids(self, folder_paths: List[str]) -> List[str]:
+        """
+        Look up the folders missing from the folder cache in batched IN queries and cache them
+
+        Args:
+            folder_paths: Paths of the folders to look up
+
+        Returns:
+            List[str]: Paths that are not tracked, in their original order
+        """
+        uncached_paths = [path for path in folder_paths if path not in self._folder_cache]
+        for batch_start in range(0, len(uncached_paths), SYNC_LOOKUP_BATCH_SIZE):
+            batch_paths = uncached_paths[batch_start:batch_start + SYNC_LOOKUP_BATCH_SIZE]
+            for path, folder_id in self.db.query(Folders.folder_path, Folders.folder_id).filter(
+                Folders.folder_path.in_(batch_paths)
+            ):
+                self._folder_cache[path] = folder_id
+
+        return [path for path in uncached_paths if path not in self._folder_cache]
+
+    def _get_root_folder_id(self) -> str:
+        """
+        Get the root folder's ID, creating the root folder if needed
+
+        Returns:
+            str: Folder ID of the root folder
+        """
+        folder_id = self._folder_cache.get(self.sync_dir)
+        if folder_id is None:
+            folder_id = self._get_or_create_root_folder().folder_id
+        return folder_id
+
     def ensure_parent_directories(self, directory_path: str) -> str:
         """
         Ensure that all parent directories in the path are tracked in the database
@@ -186,25 +548,28 @@ class SyncEngine:
         Returns:
             str: Folder ID of the parent directory
         """
+        # Most calls are for folders that are already tracked
+        existing_dir_id = self._folder_cache.get(directory_path)
+        if existing_dir_id:
+            return existing_dir_id
+
         # Skip if this is the sync directory itself or not within it
-        if directory_path == self.sync_dir or not directory_path.startswith(self.sync_dir):
+        if not directory_path.startswith(self._sync_dir_prefix):
             # Return the root folder ID
-            root_folder = self._get_or_create_root_folder()
-            return root_folder.folder_id
+            return self._get_root_folder_id()
 
         # Check if the directory itself exists in the database
-        existing_dir = self.find_existing_folder(directory_path)
-        if existing_dir:
+        existing_dir_id = self._find_folder_id(directory_path)
+        if existing_dir_id:
             # If the directory exists, return its ID
-            return existing_dir.folder_id
+            return existing_dir_id
 
         # For file paths, we need to ensure the parent directory exists
         parent_dir = os.path.dirname(directory_path)
 
         # If the parent is the sync directory, return the root folder ID
         if parent_dir == self.sync_dir:
-            root_folder = self._get_or_create_root_folder()
-            return root_folder.folder_id
+            return self._get_root_folder_id()
 
         # Ensure all parent directories exist in the database
         return self._ensure_folder_tree(directory_path)
@@ -222,13 +587,13 @@ class SyncEngine:
 
         if not root_folder:
             # Create root folder
-            root_id = str(uuid.uuid4())
+            root_id = new_id()
             root_name = os.path.basename(self.sync_dir)
 
             # Create the physical directory if it doesn't exist
             if not os.path.exists(self.sync_dir):
                 os.makedirs(self.sync_dir, exist_ok=True)
-                print(f"Created physical directory: {self.sync_dir}")
+                logger.info("Created physical directory: %s", self.sync_dir)
 
             root_folder = Folders(
                 folder_id=root_id,
@@ -239,15 +604,13 @@ class SyncEngine:
 
             self.db.add(root_folder)
             self.db.commit()
-            print(f"Added root folder to local database: {self.sync_dir}")
+            self._folder_cache[self.sync_dir] = root_id
+            logger.info("Added root folder to local database: %s", self.sync_dir)
 
             # Sync root folder with server
             try:
-                from server.client import FileServiceClient
-                api_client = FileServiceClient()
-
                 # Send root folder information to server
-                response = api_client.create_folder(
+                response = self.api_client.create_folder(
                     folder_id=root_id,
                     folder_path=self.sync_dir,
                     folder_name=root_name,
@@ -255,17 +618,22 @@ class SyncEngine:
                 )
 
                 if response.get('success'):
-                    print(f"Successfully synced root folder with server")
+                    logger.info("Successfully synced root folder with server")
                 else:
-                    print(f"Failed to sync root folder with server: {response}")
+                    logger.warning("Failed to sync root folder with server: %s", response)
             except Exception as e:
-                print(f"Error syncing root folder with server: {e}")
+                logger.error("Error syncing root folder with server: %s", e)
+        else:
+            self._folder_cache[self.sync_dir] = root_folder.folder_id
 
         return root_folder
 
     def _ensure_folder_tree(self, folder_path: str) -> str:
         """
-        Recursively ensure that a folder and all its parent folders exist in the database
+        Ensure that a folder and all its parent folders exist in the database
+
+        Ancestors missing from the folder cache are looked up with one query, and
+        any that are still missing are created together with one insert.
 
         Args:
             folder_path: Path to the folder
@@ -275,77 +643,78 @@ class SyncEngine:
         """
         # Skip if this is the sync directory itself
         if folder_path == self.sync_dir:
-            root_folder = self._get_or_create_root_folder()
-            return root_folder.folder_id
-
-        # Check if folder already exists
-        existing_folder = self.find_existing_folder(folder_path)
-        if existing_folder:
-            return existing_folder.folder_id
-
-        # Ensure parent folder exists first (recursive)
-        parent_dir = os.path.dirname(folder_path)
-        if parent_dir == self.sync_dir:
-            parent_folder_id = self._get_or_create_root_folder().folder_id
-        else:
-            parent_folder_id = self._ensure_folder_tree(parent_dir)
+            return self._get_root_folder_id()
+
+        existing_folder_id = self._folder_cache.get(folder_path)
+        if existing_folder_id:
+            return existing_folder_id
+
+        # Every folder between the sync directory and this one, outermost first
+        ancestors = [
+            str(parent) for parent in reversed(PurePosixPath(folder_path).parents)
+            if str(parent).startswith(self._sync_dir_prefix)
+        ]
+        ancestors.append(folder_path)
+
+        missing_paths = self._cache_folder_ids(ancestors)
+        if missing_paths:
+            # Create the physical directories if they don't exist
+            os.makedirs(folder_path, exist_ok=True)
+            self._create_folders_bulk(missing_paths)
 
-        # Now create this folder in the database
-        return self._create_folder_in_db(folder_path, parent_folder_id)
+        return self._folder_cache[folder_path]
 
-    def _create_folder_in_db(self, folder_path: str, parent_folder_id: str) -> str:
+    def _create_folders_bulk(self, folder_paths: List[str]) -> List[str]:
         """
-        Create a folder in the database and sync with server
+        Create many folders in the database with one insert and sync them with one server request
 
         Args:
-            folder_path: Path to the folder
-            parent_folder_id: ID of the parent folder
+            folder_paths: Paths of the folders to create, parents listed before their children
 
         Returns:
-            str: Folder ID of the created folder
+            List[str]: Folder IDs of the created folders
         """
-        # Create folder entry
-        folder_id = str(uuid.uuid4())
-        folder_name = os.path.basename(folder_path)
-
-        # Create the physical directory if it doesn't exist
-        if not os.path.exists(folder_path):
-            os.makedirs(folder_path, exist_ok=True)
-            print(f"Created physical directory: {folder_path}")
-
-        # Create folder in local database
-        folder = Folders(
-            folder_id=folder_id,
-            folder_path=folder_path,
-            folder_name=folder_name,
-            parent_folder_id=parent_folder_id
-        )
-
-        self.db.add(folder)
+        folder_rows = []
+        new_folder_ids = {}
+        for folder_path in folder_paths:
+            if folder_path in self._folder_cache or folder_path in new_folder_ids:
+                continue
+
+            # The parent is either already tracked or earlier in this batch; anything
+            # else (such as a skipped hidden directory) goes through the single-folder path
+            parent_dir = os.path.dirname(folder_path)
+            parent_folder_id = new_folder_ids.get(parent_dir) or self._ensure_folder_tree(parent_dir)
+
+            folder_id = new_id()
+            new_folder_ids[folder_path] = folder_id
+            folder_rows.append({
+                'folder_id': folder_id,
+                'folder_path': folder_path,
+                'folder_name': os.path.basename(folder_path),
+                'parent_folder_id': parent_folder_id
+            })
+
+        if not folder_rows:
+            return []
+
+        # Create folders in local database
+        self.db.execute(insert(Folders), folder_rows)
         self.db.commit()
-        print(f"Added folder to local database: {folder_path}")
+        self._folder_cache.update(new_folder_ids)
+        logger.info("Added %s folders to local database", len(folder_rows))
 
-        # Sync folder with server
+        # Sync all new folders with server
         try:
-            from server.client import FileServiceClient
-            api_client = FileServiceClient()
-
-            # Send folder information to server
-            response = api_client.create_folder(
-                folder_id=folder_id,
-                folder_path=folder_path,
-                folder_name=folder_name,
-                parent_folder_id=parent_folder_id
-            )
+            response = self.api_client.create_folders_bulk(folder_rows)
 
             if response.get('success'):
-                print(f"Successfully synced folder {folder_path} with server")
+                logger.info("Successfully synced %s folders with server", len(folder_rows))
             else:
-                print(f"Failed to sync folder {folder_path} with server: {response}")
+                logger.warning("Failed to sync folders with server: %s", response)
         except Exception as e:
-            print(f"Error syncing folder {folder_path} with server: {e}")
+            logger.error("Error syncing folders with server: %s", e)
 
-        return folder_id
+        return list(new_folder_ids.values())
 
     def download_file(self, file_id: str, destination_path: str) -> bool:
         """
@@ -363,35 +732,160 @@ class SyncEngine:
         if not file_metadata:
             return False
 
-        # Get file chunks
-        chunks = self.db.query(Chunks).filter(Chunks.file_id == file_id).order_by(Chunks.chunk_id).all()
+        # Get file chunks in part order (sorted by the database)
+        chunks = self.db.query(Chunks).filter(Chunks.file_id == file_id).order_by(Chunks.part_number).all()
         if not chunks:
             return False
 
-        # Reassemble file from chunks stored in the chunk directory
-        print(f"Reassembling file from chunks in {CHUNK_DIR}")
-        with open(destination_path, 'wb') as f:
-            # Sort chunks by part_number to ensure correct order
-            for chunk in sorted(chunks, key=lambda x: x.part_number):
-                chunk_path = os.path.join(CHUNK_DIR, f"{chunk.chunk_id}.chunk")
-                print(f"Looking for chunk at: {chunk_path}")
-                if os.path.exists(chunk_path):
-                    print(f"Found chunk at: {chunk_path}")
-                    with open(chunk_path, 'rb') as chunk_file:
-                        f.write(chunk_file.read())
-                else:
-                    print(f"Warning: Chunk not found at {chunk_path}")
-                    # Try alternative path format as fallback
-                    alt_chunk_path = os.path.join(CHUNK_DIR, f"{file_id}_{chunk.part_number-1}.chunk")
-                    if os.path.exists(alt_chunk_path):
-                        print(f"Found chunk at alternative path: {alt_chunk_path}")
-                        with open(alt_chunk_path, 'rb') as chunk_file:
-                            f.write(chunk_file.read())
-                    else:
-                        print(f"Warning: Chunk not found at alternative path {alt_chunk_path} either")
+        # Reassemble file from the packed chunk file in the chunk directory
+        chunk_path = self._packed_chunk_path(file_id)
+        logger.debug("Reassembling file from chunks in %s", chunk_path)
+        try:
+            packed_file = open(chunk_path, 'rb')
+        except FileNotFoundError:
+            logger.warning("Chunk file not found at %s", chunk_path)
+            return False
+
+        with packed_file, open(destination_path, 'wb') as f:
+            self._advise_sequential(packed_file)
+            for chunk in chunks:
+                if chunk.chunk_offset is None or chunk.chunk_length is None:
+                    logger.warning("No location recorded for chunk %s", chunk.chunk_id)
+                    continue
+                self._copy_chunk_into(f, packed_file, chunk.chunk_offset, chunk.chunk_length)
 
         return True
 
+    def _advise_sequential(self, packed_file):
+        """
+        Tell the kernel a packed chunk file is about to be read front to back, so it reads ahead
+
+        Args:
+            packed_file: Packed chunk file opened for binary reading
+        """
+        if not USE_FADVISE:
+            return
+        try:
+            os.posix_fadvise(packed_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError as e:
+            logger.debug("Could not set read-ahead for %s: %s", packed_file.name, e)
+
+    def _copy_chunk_into(self, dest_file, packed_file, chunk_offset: int, chunk_length: int):
+        """
+        Append one chunk of a packed chunk file to an open destination file without reading it into Python
+
+        Args:
+            dest_file: Destination file opened for binary writing
+            packed_file: Packed chunk file opened for binary reading
+            chunk_offset: Byte offset of the chunk in the packed file
+            chunk_length: Length of the chunk in bytes
+        """
+        if not USE_SENDFILE:
+            packed_file.seek(chunk_offset)
+            remaining = chunk_length
+            while remaining > 0:
+                data = packed_file.read(min(COPY_BUFFER_SIZE, remaining))
+                if not data:
+                    break
+                dest_file.write(data)
+                remaining -= len(data)
+            return
+
+        # Copy in the kernel; dest_file is only ever written through its descriptor here
+        dest_file.flush()
+        offset = chunk_offset
+        remaining = chunk_length
+        while remaining > 0:
+            sent = os.sendfile(dest_file.fileno(), packed_file.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+    def _read_chunk(self, fd: int, chunk_offset: int, chunk_length: int) -> bytes:
+        """
+        Read one chunk of a file with a positioned read
+
+        Args:
+            fd: Descriptor of the file
+            chunk_offset: Byte offset of the chunk in the file
+            chunk_length: Size of the chunk in bytes
+
+        Returns:
+            bytes: Chunk content
+
+        Raises:
+            OSError: If the file ends before the chunk does, as it was truncated meanwhile
+        """
+        chunk_data = os.pread(fd, chunk_length, chunk_offset)
+        if len(chunk_data) != chunk_length:
+            raise OSError(f"File shrank while reading {chunk_length} bytes at offset {chunk_offset}")
+        return chunk_data
+
+    def _read_chunk_into(self, fd: int, chunk_buffer: memoryview, chunk_offset: int):
+        """
+        Read one chunk of a file into a buffer with a positioned read
+
+        Args:
+            fd: Descriptor of the file
+            chunk_buffer: Buffer exactly the size of the chunk
+            chunk_offset: Byte offset of the chunk in the file
+
+        Raises:
+            OSError: If the file ends before the chunk does, as it was truncated meanwhile
+        """
+        if USE_PREADV:
+            size = os.preadv(fd, [chunk_buffer], chunk_offset)
+        else:
+            chunk_data = os.pread(fd, len(chunk_buffer), chunk_offset)
+            size = len(chunk_data)
+            chunk_buffer[:size] = chunk_data
+        if size != len(chunk_buffer):
+            raise OSError(f"File shrank while reading {len(chunk_buffer)} bytes at offset {chunk_offset}")
+
+    def _same_file_contents(self, before: os.stat_result, after: os.stat_result) -> bool:
+        """
+        Check that two stats of a file show the same file, unchanged in between
+
+        Args:
+            before: Earlier stat of the file
+            after: Later stat of the file
+
+        Returns:
+            bool: True if the inode, size and modification time all match
+        """
+        return ((before.st_dev, before.st_ino, before.st_size, before.st_mtime_ns)
+                == (after.st_dev, after.st_ino, after.st_size, after.st_mtime_ns))
+
+    def _write_chunk(self, packed_fd: int, source_fd: Optional[int], chunk_data: memoryview, chunk_offset: int):
+        """
+        Write one chunk into a packed chunk file at the offset it has in its source file
+
+        Args:
+            packed_fd: Descriptor of the packed chunk file
+            source_fd: Descriptor of the source file to copy from in the kernel, or None
+            chunk_data: Chunk content, as read from the source file
+            chunk_offset: Byte offset of the chunk in both files
+        """
+        if source_fd is not None:
+            written = 0
+            try:
+                while written < len(chunk_data):
+                    offset = chunk_offset + written
+                    copied = os.copy_file_range(source_fd, packed_fd, len(chunk_data) - written, offset, offset)
+                    if copied == 0:
+                        break
+                    written += copied
+            except OSError:
+                # Not supported between these files (older kernel, filesystem); write the rest
+                pass
+            if written == len(chunk_data):
+                return
+            chunk_data = chunk_data[written:]
+            chunk_offset += written
+
+        os.pwrite(packed_fd, chunk_data, chunk_offset)
+
     def update_file_location(self, old_path: str, new_path: str) -> bool:
         """
         Update a file's location in the database when it's moved or renamed
@@ -410,7 +904,7 @@ class SyncEngine:
             ).first()
 
             if not file_metadata:
-                print(f"File not found at path {old_path}")
+                logger.warning("File not found at path %s", old_path)
                 return False
 
             # Extract new file name and parent path
@@ -427,15 +921,12 @@ class SyncEngine:
 
             # Commit changes
             self.db.commit()
-            print(f"Updated file location from {old_path} to {new_path}")
+            logger.info("Updated file location from %s to %s", old_path, new_path)
 
             # Sync changes with server
             try:
-                from server.client import FileServiceClient
-                api_client = FileServiceClient()
-
                 # Send updated file information to server
-                response = api_client.update_file(
+                response = self.api_client.update_file(
                     file_id=file_metadata.file_id,
                     file_name=new_file_name,
                     file_path=new_path,
@@ -443,16 +934,16 @@ class SyncEngine:
                 )
 
                 if response.get('success'):
-                    print(f"Successfully synced file location update with server")
+                    logger.info("Successfully synced file location update with server")
                 else:
-                    print(f"Failed to sync file location update with server: {response}")
+                    logger.warning("Failed to sync file location update with server: %s", response)
             except Exception as e:
-                print(f"Error syncing file location update with server: {e}")
+                logger.error("Error syncing file location update with server: %s", e)
 
             return True
 
         except Exception as e:
-            print(f"Error updating file location: {e}")
+            logger.error("Error updating file location: %s", e)
             self.db.rollback()
             return False
 
@@ -474,7 +965,7 @@ class SyncEngine:
             ).first()
 
             if not folder:
-                print(f"Folder not found at path {old_path}")
+                logger.warning("Folder not found at path %s", old_path)
                 return False
 
             # Extract new folder name and parent path
@@ -482,56 +973,37 @@ class SyncEngine:
             new_parent_path = os.path.dirname(new_path)
 
             # Find parent folder
-            parent_folder = None
-            if new_parent_path != self.sync_dir:
-                parent_folder = self.db.query(Folders).filter(
-                    Folders.folder_path == new_parent_path
-                ).first()
-
-                if not parent_folder:
-                    # Create parent folder if it doesn't exist
-                    parent_folder_id = self._ensure_folder_tree(new_parent_path)
-                    parent_folder = self.db.query(Folders).filter(
-                        Folders.folder_id == parent_folder_id
-                    ).first()
+            if new_parent_path == os.path.dirname(folder.folder_path):
+                # Renamed in place: the parent folder is unchanged
+                parent_folder_id = folder.parent_folder_id
+            elif new_parent_path != self.sync_dir:
+                # Looks up the parent (cache first) and creates it if it doesn't exist
+                parent_folder_id = self._ensure_folder_tree(new_parent_path)
+            else:
+                # If no parent folder, this is a top-level folder
+                parent_folder_id = self._get_root_folder_id()
 
             # Update folder metadata
             old_folder_path = folder.folder_path
             folder.folder_path = new_path
             folder.folder_name = new_folder_name
-            if parent_folder:
-                folder.parent_folder_id = parent_folder.folder_id
-            else:
-                # If no parent folder, this is a top-level folder
-                root_folder = self._get_or_create_root_folder()
-                folder.parent_folder_id = root_folder.folder_id
-
-            # Update paths for all files in this folder
-            files_to_update = self.db.query(FilesMetaData).filter(
-                FilesMetaData.folder_id == folder.folder_id
-            ).all()
-
-            for file in files_to_update:
-                # Calculate new file path
-                new_file_path = file.file_path.replace(old_folder_path, new_path)
+            folder.parent_folder_id = parent_folder_id
 
-                # Update file path
-                file.file_path = new_file_path
-
-            # Update paths for all subfolders recursively
-            self._update_subfolder_paths(folder.folder_id, old_folder_path, new_path)
+            # Rewrite the path prefix of every descendant file and folder in two statements
+            self._update_subtree_paths(old_folder_path, new_path)
 
             # Commit changes
             self.db.commit()
-            print(f"Updated folder location from {old_path} to {new_path}")
+            logger.info("Updated folder location from %s to %s", old_path, new_path)
+
+            # Cached IDs under the old path no longer match any folder_path
+            self._invalidate_folder_cache(old_folder_path)
+            self._folder_cache[new_path] = folder.folder_id
 
             # Sync changes with server
             try:
-                from server.client import FileServiceClient
-                api_client = FileServiceClient()
-
                 # Send updated folder information to server
-                response = api_client.update_folder(
+                response = self.api_client.update_folder(
                     folder_id=folder.folder_id,
                     folder_name=new_folder_name,
                     folder_path=new_path,
@@ -539,61 +1011,59 @@ class SyncEngine:
                 )
 
                 if response.get('success'):
-                    print(f"Successfully synced folder location update with server")
+                    logger.info("Successfully synced folder location update with server")
                 else:
-                    print(f"Failed to sync folder location update with server: {response}")
+                    logger.warning("Failed to sync folder location update with server: %s", response)
             except Exception as e:
-                print(f"Error syncing folder location update with server: {e}")
+                logger.error("Error syncing folder location update with server: %s", e)
 
             return True
 
         except Exception as e:
-            print(f"Error updating folder location: {e}")
+            logger.error("Error updating folder location: %s", e)
             self.db.rollback()
             return False
 
-    def _update_subfolder_paths(self, parent_folder_id: str, old_base_path: str, new_base_path: str):
+    def _invalidate_folder_cache(self, folder_path: str):
         """
-        Recursively update paths for all subfolders of a folder
+        Drop cached folder IDs for a folder and everything beneath it
 
         Args:
-            parent_folder_id: ID of the parent folder
-            old_base_path: Original base path
-            new_base_path: New base path
+            folder_path: Path to the folder
         """
-        # Get all subfolders
-        subfolders = self.db.query(Folders).filter(
-            Folders.parent_folder_id == parent_folder_id
-        ).all()
-
-        for subfolder in subfolders:
-            # Calculate new subfolder path
-            old_subfolder_path = subfolder.folder_path
-            new_subfolder_path = old_subfolder_path.replace(old_base_path, new_base_path)
-
-            # Update subfolder path
-            subfolder.folder_path = new_subfolder_path
+        subfolder_prefix = folder_path + os.sep
+        for cached_path in [p for p in self._folder_cache if p == folder_path or p.startswith(subfolder_prefix)]:
+            del self._folder_cache[cached_path]
 
-            # Update paths for all files in this subfolder
-            files_to_update = self.db.query(FilesMetaData).filter(
-                FilesMetaData.folder_id == subfolder.folder_id
-            ).all()
-
-            for file in files_to_update:
-                # Calculate new file path
-                new_file_path = file.file_path.replace(old_base_path, new_base_path)
-
-                # Update file path
-                file.file_path = new_file_path
+    def _update_subtree_paths(self, old_base_path: str, new_base_path: str):
+        """
+        Replace the path prefix of all files and subfolders below a moved folder
 
-            # Recursively update subfolders
-            self._update_subfolder_paths(subfolder.folder_id, old_base_path, new_base_path)
+        Args:
+            old_base_path: Original base path
+            new_base_path: New base path
+        """
+        suffix_start = len(old_base_path) + 1
+
+        # Range predicates can use the path indexes, so renaming a leaf folder costs an index probe
+        self.db.query(Folders).filter(
+            subtree_filter(Folders.folder_path, old_base_path)
+        ).update(
+            {Folders.folder_path: literal(new_base_path) + func.substr(Folders.folder_path, suffix_start)},
+            synchronize_session=False
+        )
+        self.db.query(FilesMetaData).filter(
+            subtree_filter(FilesMetaData.file_path, old_base_path)
+        ).update(
+            {FilesMetaData.file_path: literal(new_base_path) + func.substr(FilesMetaData.file_path, suffix_start)},
+            synchronize_session=False
+        )
 
     def scan_sync_directory(self):
         """
         Scan the sync directory for files and directories and process any that aren't already in the database
         """
-        print(f"Scanning sync directory: {self.sync_dir}")
+        logger.info("Scanning sync directory: %s", self.sync_dir)
 
         # Track statistics
         file_count = 0
@@ -602,53 +1072,73 @@ class SyncEngine:
         skipped_count = 0
 
         # Ensure root folder exists
-        root_folder = self._get_or_create_root_folder()
+        self._load_folder_cache()
+        self._get_root_folder_id()
         dir_count += 1
 
-        # Process all directories and files
-        for root, dirs, files in os.walk(self.sync_dir):
-            # Process directories
+        # Fetch the files already tracked under the sync directory up front, instead of
+        # issuing one SELECT per walked file (folders come from the folder cache)
+        known_files = {
+            row.file_path: row
+            for row in self.db.query(
+                FilesMetaData.file_path, FilesMetaData.file_hash, FilesMetaData.mtime_ns, FilesMetaData.file_size
+            ).filter(subtree_filter(FilesMetaData.file_path, self.sync_dir)).all()
+        }
+
+        # Walk the tree once up front so every new folder can be created in a single batch
+        walked = list(os.walk(self.sync_dir))
+        new_folder_paths = []
+        for root, dirs, files in walked:
             for dirname in dirs:
-                dir_path = os.path.join(root, dirname)
-
                 # Skip hidden directories
                 if dirname.startswith('.'):
                     continue
 
-                # Process this directory and ensure it's in the database
-                folder_id = self._ensure_folder_tree(dir_path)
+                dir_path = os.path.join(root, dirname)
+                if dir_path not in self._folder_cache:
+                    new_folder_paths.append(dir_path)
                 dir_count += 1
 
-            # Process files
-            for filename in files:
-                file_path = os.path.join(root, filename)
-
-                # Skip hidden files
-                if filename.startswith('.'):
-                    continue
-
-                file_count += 1
-
-                # Process the file
+        self._create_folders_bulk(new_folder_paths)
+
+        # Skip hidden files
+        file_paths = [
+            os.path.join(root, filename)
+            for root, dirs, files in walked
+            for filename in files
+            if not filename.startswith('.')
+        ]
+        file_count = len(file_paths)
+
+        # Stat and hash files on a thread pool (hashing releases the GIL); the session is
+        # only used from this thread, which applies the results one file at a time
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="scan") as scan_pool:
+            scans = [
+                scan_pool.submit(self._stat_and_hash_scanned_file, file_path, known_files.get(file_path))
+                for file_path in file_paths
+            ]
+
+            # Process the files in walk order as their results complete
+            for file_path, scan_future in zip(file_paths, scans):
                 try:
-                    # Check if file already exists at this path
-                    existing_file = self.find_existing_file(file_path, None)
+                    file_stat, file_hash = scan_future.result()
 
-                    if existing_file and existing_file.file_hash:
-                        # Calculate hash to check if content has changed
-                        current_hash = self.calculate_file_hash(file_path)
-
-                        if existing_file.file_hash == current_hash:
-                            print(f"Skipping unchanged file: {file_path}")
+                    known_file = known_files.get(file_path)
+                    if known_file and known_file.file_hash and (
+                            file_hash is None or file_hash == known_file.file_hash):
+                        if file_hash is None:
+                            logger.debug("Skipping unchanged file: %s", file_path)
                             skipped_count += 1
                             continue
+                        logger.debug("File touched but content unchanged: %s", file_path)
 
-                    # Process the file (either new or changed)
-                    file_id = self.upload_file(file_path)
-                    print(f"Processed file: {file_path} with ID: {file_id}")
+                    # Process the file (either new or changed); a new file is hashed while
+                    # it is chunked, and only a changed hash rewrites a known file's chunks
+                    file_id = self.upload_file(file_path, file_stat, file_hash)
+                    logger.info("Processed file: %s with ID: %s", file_path, file_id)
                     processed_count += 1
                 except Exception as e:
-                    print(f"Error processing file {file_path}: {e}")
+                    logger.error("Error processing file %s: %s", file_path, e)
 
         # Commit any remaining changes
         self.db.commit()
@@ -656,10 +1146,36 @@ class SyncEngine:
         # Clean up orphaned chunks
         self.cleanup_orphaned_chunks()
 
-        print(f"Scan complete. Found {file_count} files and {dir_count} directories.")
-        print(f"Processed {processed_count} files, skipped {skipped_count} unchanged files.")
+        logger.info("Scan complete. Found %s files and %s directories.", file_count, dir_count)
+        logger.info("Processed %s files, skipped %s unchanged files.", processed_count, skipped_count)
 
-    def _process_file_chunks(self, file_path: str, file_id: str, chunk_size: int = CHUNK_SIZE):
+    def _stat_and_hash_scanned_file(self, file_path: str, known_file: Optional[Row]
+                                    ) -> Tuple[os.stat_result, Optional[bytes]]:
+        """
+        Stat a scanned file and hash it if it is tracked but may have changed; runs on a
+        scan worker and never touches the session
+
+        Args:
+            file_path: Path to the file
+            known_file: Tracked path, hash, mtime and size of the file, if any
+
+        Returns:
+            Tuple[os.stat_result, Optional[bytes]]: Stat of the file, and its hash if it was
+                                                    computed (None when the file is new or
+                                                    its size and mtime are unchanged)
+        """
+        file_stat = os.stat(file_path)
+        if not known_file or not known_file.file_hash:
+            return file_stat, None
+
+        # Same size and modification time as when it was last hashed: unchanged
+        if known_file.mtime_ns == file_stat.st_mtime_ns and known_file.file_size == file_stat.st_size:
+            return file_stat, None
+
+        return file_stat, self.calculate_file_hash(file_path, file_stat)
+
+    def _process_file_chunks(self, file_path: str, file_id: str, chunk_size: Optional[int] = None,
+                             previous_hash: Optional[bytes] = None, file_values: Optional[Dict] = None):
         """
         Process a file into chunks and upload to the file service
 
@@ -667,147 +1183,200 @@ class SyncEngine:
         2. Send file metadata to the file service
         3. Upload chunks using presigned URLs
         4. Confirm successful uploads
+        5. Write the file's row and its chunk rows in one transaction
+
+        Nothing is written to the database before the last step, so SQLite's write lock
+        isn't held while the file is hashed and uploaded.
 
         Args:
             file_path: Path to the file to process
             file_id: ID of the file
-            chunk_size: Size of each chunk in bytes (default: 5MB)
+            chunk_size: Size of each chunk in bytes (default: picked from the file size)
+            previous_hash: Hash of the file's content when it was last chunked; processing
+                           stops if the content turns out to be the same
+            file_values: Columns of the file's row to write along with its chunks, including
+                         folder_id and file_hash; the row is added if the file has none yet
+                         (default: the file's existing row is used as it is)
         """
-        from server.client import FileServiceClient
 
         # Get file metadata
-        file_name = os.path.basename(file_path)
-        _, file_extension = os.path.splitext(file_path)
-        file_type = file_extension[1:] if file_extension else "unknown"
+        _, file_name, file_type = split_file_path(file_path)
 
         # Get folder ID
         file_metadata = self.db.query(FilesMetaData).filter(FilesMetaData.file_id == file_id).first()
-        if not file_metadata:
-            print(f"Error: File metadata not found for file ID {file_id}")
-            return
-
-        folder_id = file_metadata.folder_id
-        file_hash = file_metadata.file_hash
-
-        # First pass: count chunks and collect fingerprints
-        chunk_count = 0
-        fingerprints = []
+        if file_values is None:
+            if not file_metadata:
+                logger.error("File metadata not found for file ID %s", file_id)
+                return
+            file_values = {}
+            folder_id = file_metadata.folder_id
+            file_hash = file_metadata.file_hash
+        else:
+            folder_id = file_values['folder_id']
+            file_hash = file_values['file_hash']
 
+        # Chunks are read with positioned reads rather than sliced from a mapping of the file:
+        # touching a mapping of a file that another process has truncated (an editor saving
+        # it, a shell redirection) raises SIGBUS, which would kill the whole client
         with open(file_path, 'rb') as f:
-            while True:
-                chunk_data = f.read(chunk_size)
-                if not chunk_data:
-                    break
+            file_stat = os.fstat(f.fileno())
+            file_size = file_stat.st_size
+
+            # The chunk count follows from the file size
+            if chunk_size is None:
+                chunk_size = choose_chunk_size(file_size)
+            chunk_count = (file_size + chunk_size - 1) // chunk_size
+
+            # A file without a hash yet is hashed in the same pass that fingerprints its chunks
+            fingerprints = None
+            if file_hash is None:
+                file_hash, fingerprints = self._hash_file_and_chunks(f.fileno(), file_size, chunk_size, chunk_count)
+                self._remember_file_hash(file_stat, file_hash)
+        file_values = dict(file_values, file_hash=file_hash)
+
+        if previous_hash is not None and file_hash == previous_hash:
+            logger.debug("File content unchanged. Skipping chunk processing.")
+            self._write_file_row(file_metadata, file_id, file_values)
+            self.db.commit()
+            return
 
-                # Calculate fingerprint (hash) of chunk
-                fingerprint = hashlib.sha256(chunk_data).hexdigest()
-                fingerprints.append(fingerprint)
-                chunk_count += 1
+        logger.debug("File %s will be split into %s chunks", file_path, chunk_count)
 
-        print(f"File {file_path} will be split into {chunk_count} chunks")
+        # Local chunk metadata rows, inserted together once the uploads have finished
+        chunk_rows = []
+        created_at = datetime.now(timezone.utc)
+        confirmed = False
 
-        # Initialize API client
-        api_client = FileServiceClient()
+        # The chunks go to a new packed chunk file that replaces the file's current one only
+        # once the upload is confirmed; until then the current one keeps the last uploaded
+        # version that the old chunk rows point into
+        chunk_path = self._packed_chunk_path(file_id)
+        new_chunk_path = None
 
         try:
             # Step 1: Send file metadata to file service and get presigned URLs
-            print(f"Sending file metadata to file service for {file_path}")
-            response = api_client.create_file(
+            logger.debug("Sending file metadata to file service for %s", file_path)
+            response = self.api_client.create_file(
                 file_id=file_id,  # Pass the client-generated file ID
                 file_name=file_name,
                 file_path=file_path,
                 file_type=file_type,
                 folder_id=folder_id,
                 chunk_count=chunk_count,
-                file_hash=file_hash
+                file_hash=format_file_hash(file_hash),
+                chunk_size=chunk_size
             )
 
             remote_file_id = response.get('file_id')
             presigned_urls = response.get('presigned_urls', [])
 
-            if not remote_file_id or not presigned_urls:
-                print(f"Error: Invalid response from file service: {response}")
-                return
+            # An empty file has no parts, so it gets no presigned URLs
+            if not remote_file_id or (chunk_count and not presigned_urls):
+                raise ValueError(f"Invalid response from file service: {response}")
 
-            print(f"Received file ID {remote_file_id} and {len(presigned_urls)} presigned URLs")
+            logger.debug("Received file ID %s and %s presigned URLs", remote_file_id, len(presigned_urls))
 
             # Step 2: Upload chunks using presigned URLs
             successful_chunk_ids = []
 
-            with open(file_path, 'rb') as f:
-                for i in range(chunk_count):
-                    chunk_data = f.read(chunk_size)
-                    if not chunk_data:
-                        break
+            # Chunks are taken in groups of HASH_LANES: each group is fingerprinted
+            # together, saved, and uploaded on a pool of UPLOAD_CONCURRENCY workers.
+            # A sliding window starts the next upload as soon as any one finishes, so at
+            # most UPLOAD_CONCURRENCY chunks are held in memory for uploading at a time
+            upload_pool_size = UPLOAD_CONCURRENCY
+            upload_window = threading.BoundedSemaphore(upload_pool_size)
+            pending_uploads = {}
 
-                    # Generate chunk ID
-                    chunk_id = f"{file_id}_{i}"
-                    local_chunk_id = chunk_id  # For local storage
-                    remote_chunk_id = presigned_urls[i]['chunk_id']  # From API response
+            # All chunks of the file are saved into one packed chunk file at their offsets
+            packed_fd, new_chunk_path = tempfile.mkstemp(dir=CHUNK_DIR, prefix=f"{file_id}.", suffix='.tmp')
+            logger.debug("Saving chunks to: %s", new_chunk_path)
 
-                    # Calculate fingerprint (hash) of chunk
-                    fingerprint = hashlib.sha256(chunk_data).hexdigest()
+            with os.fdopen(packed_fd, 'wb') as packed_file, open(file_path, 'rb') as source_file, \
+                    ThreadPoolExecutor(max_workers=upload_pool_size) as upload_pool:
+                source_fd = source_file.fileno() if USE_COPY_FILE_RANGE else None
 
-                    # Save chunk to the dedicated chunk directory (not in sync dir)
-                    chunk_path = os.path.join(CHUNK_DIR, f"{local_chunk_id}.chunk")
-                    print(f"Saving chunk to: {chunk_path}")
+                # The chunks must come from the same file, of the same size, that was hashed
+                if not self._same_file_contents(file_stat, os.fstat(source_file.fileno())):
+                    raise OSError(f"{file_path} changed while it was being processed")
+
+                # Reserve the space in one go instead of growing the packed file chunk by chunk
+                if file_size and hasattr(os, 'posix_fallocate'):
                     try:
-                        with open(chunk_path, 'wb') as chunk_file:
-                            chunk_file.write(chunk_data)
-                        print(f"Successfully saved chunk to {chunk_path}")
-                    except Exception as e:
-                        print(f"Error saving chunk to {chunk_path}: {e}")
-                        continue
+                        os.posix_fallocate(packed_file.fileno(), 0, file_size)
+                    except OSError as e:
+                        logger.warning("Could not preallocate %s: %s", new_chunk_path, e)
+
+                for group_start in range(0, chunk_count, HASH_LANES):
+                    chunk_group = [
+                        self._read_chunk(source_file.fileno(), i * chunk_size,
+                                         min(chunk_size, file_size - i * chunk_size))
+                        for i in range(group_start, min(group_start + HASH_LANES, chunk_count))
+                    ]
+
+                    # Calculate fingerprints (hashes) of the whole group at once, unless the
+                    # file hashing pass already did
+                    if fingerprints is not None:
+                        group_fingerprints = fingerprints[group_start:group_start + len(chunk_group)]
+                    else:
+                        group_fingerprints = batch_fingerprints(chunk_group)
 
-                    # Create local chunk metadata
-                    chunk = Chunks(
-                        chunk_id=local_chunk_id,
-                        file_id=file_id,
-                        part_number=i + 1,  # Part numbers start at 1
-                        created_at=datetime.now(timezone.utc),
-                        last_synced=None,  # Will be updated after successful upload
-                        fingerprint=fingerprint
-                    )
-                    self.db.add(chunk)
-
-                    # Upload chunk to S3 using presigned URL
-                    presigned_url = presigned_urls[i]['presigned_url']
-                    print(f"Uploading chunk {i+1}/{chunk_count} to S3...")
-
-                    upload_success, etag = api_client.upload_chunk(presigned_url, chunk_data)
-                    if upload_success:
-                        print(f"Successfully uploaded chunk {i+1}/{chunk_count}" + (f" with ETag: {etag}" if etag else ""))
-
-                        # Store chunk info with ETag and fingerprint
-                        # Important: We must use the exact ETag returned by S3/MinIO
-                        # This is critical for the multipart upload completion
-                        chunk_info = {
-                            'chunk_id': remote_chunk_id,
+                    for group_index, (chunk_data, fingerprint) in enumerate(zip(chunk_group, group_fingerprints)):
+                        i = group_start + group_index
+
+                        # Generate chunk ID
+                        chunk_id = f"{file_id}_{i}"
+                        local_chunk_id = chunk_id  # For local storage
+
+                        # Save chunk to the dedicated chunk directory (not in sync dir)
+                        chunk_offset = i * chunk_size
+                        try:
+                            self._write_chunk(packed_file.fileno(), source_fd, chunk_data, chunk_offset)
+                        except Exception as e:
+                            logger.error("Error saving chunk %s to %s: %s", local_chunk_id, new_chunk_path, e)
+                            continue
+
+                        # Create local chunk metadata
+                        chunk_row = {
+                            'chunk_id': local_chunk_id,
+                            'file_id': file_id,
                             'part_number': i + 1,  # Part numbers start at 1
-                            'etag': etag,  # Use the exact ETag from S3/MinIO
-                            'fingerprint': fingerprint  # Include the SHA-256 fingerprint
+                            'created_at': created_at,
+                            'last_synced': None,  # Will be updated after successful upload
+                            'fingerprint': fingerprint,  # Raw 32-byte SHA-256 digest
+                            'chunk_offset': chunk_offset,
+                            'chunk_length': len(chunk_data)
                         }
+                        chunk_rows.append(chunk_row)
 
-                        # Only add to successful chunks if we got an ETag
-                        if etag:
-                            successful_chunk_ids.append(chunk_info)
-                            # Update last_synced timestamp
-                            chunk.last_synced = datetime.now(timezone.utc)
-                        else:
-                            print(f"Warning: No ETag received for chunk {i+1}/{chunk_count}, cannot complete multipart upload")
-                    else:
-                        print(f"Failed to upload chunk {i+1}/{chunk_count}")
+                        # Upload chunk to S3 using presigned URL
+                        logger.debug("Uploading chunk %s/%s to S3...", i+1, chunk_count)
+                        upload_window.acquire()
+                        future = upload_pool.submit(
+                            self._upload_one_part, i, chunk_data, fingerprint, presigned_urls[i], chunk_count
+                        )
+                        future.add_done_callback(lambda _: upload_window.release())
+                        pending_uploads[future] = chunk_row
+
+                self._collect_chunk_uploads(pending_uploads, successful_chunk_ids)
+
+                # A write during the upload means the parts may not match the fingerprints;
+                # leave the upload unconfirmed so the change's own event uploads the file again
+                if not self._same_file_contents(file_stat, os.fstat(source_file.fileno())):
+                    raise OSError(f"{file_path} changed while it was being uploaded")
+
+            # Uploads finish out of order; confirm the parts in part order
+            successful_chunk_ids.sort(key=lambda chunk_info: chunk_info['part_number'])
 
             # Step 3: Confirm successful uploads
             if successful_chunk_ids:
-                print(f"Confirming {len(successful_chunk_ids)} successful uploads")
-                print(f"Chunk ETags: {successful_chunk_ids}")
-                confirm_response = api_client.confirm_upload(remote_file_id, successful_chunk_ids)
-                print(f"Confirmation response: {confirm_response}")
+                logger.info("Confirming %s successful uploads", len(successful_chunk_ids))
+                logger.debug("Chunk ETags: %s", successful_chunk_ids)
+                confirm_response = self.api_client.confirm_upload(remote_file_id, successful_chunk_ids)
+                logger.debug("Confirmation response: %s", confirm_response)
 
                 # If the confirmation failed, try again with a more direct approach
                 if not confirm_response.get('success', False):
-                    print(f"Confirmation failed. Trying again with a more direct approach...")
+                    logger.warning("Confirmation failed. Trying again with a more direct approach...")
 
                     # Create a simpler chunk_etags structure
                     simple_chunk_etags = []
@@ -820,35 +1389,241 @@ class SyncEngine:
                         })
 
                     # Try again with the simpler structure
-                    retry_response = api_client.confirm_upload(remote_file_id, simple_chunk_etags)
-                    print(f"Retry confirmation response: {retry_response}")
-
-                if confirm_response.get('success'):
-                    print(f"Successfully confirmed {confirm_response.get('confirmed_chunks')} chunks")
-
-                    # Update system_last_sync_time in the System table
-                    try:
-                        system_record = self.db.query(System).filter(System.id == 1).first()
-                        if system_record:
-                            current_time = datetime.now(timezone.utc).isoformat()
-                            system_record.system_last_sync_time = current_time
-                            self.db.commit()
-                            print(f"Updated system_last_sync_time to {current_time}")
-                        else:
-                            print("Warning: System record not found, cannot update system_last_sync_time")
-                    except Exception as e:
-                        print(f"Error updating system_last_sync_time: {e}")
+                    confirm_response = self.api_client.confirm_upload(remote_file_id, simple_chunk_etags)
+                    logger.debug("Retry confirmation response: %s", confirm_response)
+
+                if not confirm_response.get('success'):
+                    logger.warning("Failed to confirm uploads: %s", confirm_response)
+                elif len(successful_chunk_ids) < chunk_count:
+                    # The file is only up to date once every part has been uploaded
+                    logger.warning("Only %s of %s chunks were uploaded", len(successful_chunk_ids), chunk_count)
                 else:
-                    print(f"Failed to confirm uploads: {confirm_response}")
+                    logger.info("Successfully confirmed %s chunks", confirm_response.get('confirmed_chunks'))
+                    confirmed = True
+            elif not chunk_count:
+                # Nothing to upload or confirm for an empty file
+                confirmed = True
             else:
-                print("No chunks were successfully uploaded")
+                logger.warning("No chunks were successfully uploaded")
 
         except Exception as e:
-            print(f"Error during file upload process: {e}")
+            logger.error("Error during file upload process: %s", e)
+
+        # The file's row, its chunk rows and the sync time are written in one short
+        # transaction once the file service has answered
+        if confirmed:
+            os.replace(new_chunk_path, chunk_path)
+            self._write_file_row(file_metadata, file_id, file_values)
+            self.db.query(Chunks).filter(Chunks.file_id == file_id).delete()
+
+            # Insert all chunk metadata in a single executemany
+            if chunk_rows:
+                self.db.execute(insert(Chunks), chunk_rows)
+
+            self._update_last_sync_time()
+        else:
+            # Keep the hash of the content last uploaded, its chunk rows and its packed chunk
+            # file, and forget the stat, so the file doesn't look up to date and the next scan
+            # or event uploads it again
+            if new_chunk_path:
+                os.unlink(new_chunk_path)
+            self._write_file_row(file_metadata, file_id, dict(
+                file_values, file_hash=previous_hash, mtime_ns=None, file_size=None))
 
         # Commit changes to local database
         self.db.commit()
 
+    def _hash_file_and_chunks(self, fd: int, file_size: int, chunk_size: int,
+                              chunk_count: int) -> Tuple[bytes, List[bytes]]:
+        """
+        Hash a whole file and fingerprint each of its chunks in one pass over its contents
+
+        Args:
+            fd: Descriptor of the file
+            file_size: Size of the file in bytes
+            chunk_size: Size of each chunk in bytes
+            chunk_count: Number of chunks in the file
+
+        Returns:
+            Tuple[bytes, List[bytes]]: Raw file digest (see FILE_HASH_ALGORITHM) and the raw
+                                       SHA-256 fingerprint of every chunk, in order
+        """
+        if blake3 is not None:
+            file_hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            file_hasher = hashlib.sha256()
+
+        # Every group of chunks is read into the same buffers, one per hash lane
+        lane_buffers = [
+            memoryview(bytearray(min(chunk_size, file_size)))
+            for _ in range(min(HASH_LANES, chunk_count))
+        ]
+
+        fingerprints = []
+        for group_start in range(0, chunk_count, HASH_LANES):
+            chunk_group = []
+            for lane, i in enumerate(range(group_start, min(group_start + HASH_LANES, chunk_count))):
+                chunk_view = lane_buffers[lane][:min(chunk_size, file_size - i * chunk_size)]
+                self._read_chunk_into(fd, chunk_view, i * chunk_size)
+                chunk_group.append(chunk_view)
+            # The whole-file digest is inherently serial, so feed it on this thread while
+            # the hash lanes fingerprint the same chunks
+            lanes = submit_fingerprints(chunk_group)
+            for chunk_data in chunk_group:
+                file_hasher.update(chunk_data)
+            fingerprints.extend(lane.result() for lane in lanes)
+
+        return file_hasher.digest(), fingerprints
+
+    def _upload_one_part(self, i: int, chunk_data: memoryview, fingerprint: bytes, presigned_url_info: Dict,
+                         chunk_count: int) -> Optional[Dict]:
+        """
+        Upload one chunk with its presigned URL; runs on an upload worker and never touches the session
+
+        Args:
+            i: Index of the chunk in the file
+            chunk_data: Chunk content, as read from the file
+            fingerprint: Raw SHA-256 fingerprint of the chunk
+            presigned_url_info: Presigned URL entry for this chunk from the file service
+            chunk_count: Total number of chunks in the file
+
+        Returns:
+            Optional[Dict]: Chunk info to confirm with the file service, or None if the upload failed
+        """
+        upload_success, etag = self.api_client.upload_chunk(presigned_url_info['presigned_url'], chunk_data)
+        if not upload_success:
+            logger.warning("Failed to upload chunk %s/%s", i+1, chunk_count)
+            return None
+
+        logger.debug("Successfully uploaded chunk %s/%s with ETag: %s", i+1, chunk_count, etag)
+
+        # Only chunks with an ETag can complete the multipart upload
+        if not etag:
+            logger.warning("No ETag received for chunk %s/%s, cannot complete multipart upload", i+1, chunk_count)
+            return None
+
+        # Store chunk info with ETag and fingerprint
+        # Important: We must use the exact ETag returned by S3/MinIO
+        # This is critical for the multipart upload completion
+        return {
+            'chunk_id': presigned_url_info['chunk_id'],  # From API response
+            'part_number': i + 1,  # Part numbers start at 1
+            'etag': etag,  # Use the exact ETag from S3/MinIO
+            'fingerprint': fingerprint.hex()  # The server expects hex SHA-256 fingerprints
+        }
+
+    def _collect_chunk_uploads(self, pending_uploads: Dict, successful_chunk_ids: list):
+        """
+        Wait for in-flight chunk uploads and record their results as they complete
+
+        Args:
+            pending_uploads: Mapping of upload future -> local chunk row
+            successful_chunk_ids: List that confirmed chunk info is appended to
+        """
+        for future in as_completed(pending_uploads):
+            chunk_info = future.result()
+            if chunk_info:
+                successful_chunk_ids.append(chunk_info)
+                # Update last_synced timestamp
+                pending_uploads[future]['last_synced'] = datetime.now(timezone.utc)
+
+    def _download_chunks(self, file_id: str, chunks_to_download: List[Dict]):
+        """
+        Download a file's chunks in parallel and add them to the session
+
+        Args:
+            file_id: ID of the file
+            chunks_to_download: Dicts with chunk_id, part_number, fingerprint (hex),
+                                fingerprint_digest and created_at for each chunk
+        """
+        logger.info("Downloading %s chunks for file %s", len(chunks_to_download), file_id)
+
+        try:
+            # Ask for every chunk's download URL in one request
+            download_response = self.api_client.get_download_urls(file_id, chunks_to_download)
+        except Exception as e:
+            logger.error("Error requesting chunk downloads for file %s: %s", file_id, e)
+            return
+
+        if not download_response.get('success', False):
+            logger.error("Error downloading chunks for file %s: %s", file_id, download_response.get('error_message'))
+            return
+
+        download_urls = {
+            url_info.get('part_number'): url_info
+            for url_info in download_response.get('download_urls', [])
+        }
+
+        # Chunks are downloaded on worker threads; the session is only used on this one
+        new_chunks = []
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY) as download_pool:
+            pending_downloads = {}
+            for chunk in chunks_to_download:
+                url_info = download_urls.get(chunk['part_number'])
+                if not url_info or not url_info.get('presigned_url'):
+                    logger.warning("No download URL returned for chunk %s", chunk['chunk_id'])
+                    continue
+
+                logger.debug("Downloading chunk %s for file %s", chunk['chunk_id'], file_id)
+                future = download_pool.submit(self._download_chunk_part, file_id, chunk['part_number'], url_info)
+                pending_downloads[future] = chunk
+
+            for future in as_completed(pending_downloads):
+                chunk = pending_downloads[future]
+                try:
+                    chunk_offset, chunk_length = future.result()
+                except Exception as e:
+                    logger.error("Error downloading chunk %s: %s", chunk['chunk_id'], e)
+                    continue
+
+                # Create chunk metadata
+                new_chunks.append(Chunks(
+                    chunk_id=chunk['chunk_id'],
+                    file_id=file_id,
+                    part_number=chunk['part_number'],
+                    created_at=datetime.fromisoformat(chunk['created_at'].replace('Z', '+00:00')),
+                    last_synced=datetime.now(timezone.utc),
+                    fingerprint=chunk['fingerprint_digest'],
+                    chunk_offset=chunk_offset,
+                    chunk_length=chunk_length
+                ))
+                logger.debug("Successfully downloaded and saved chunk %s", chunk['chunk_id'])
+
+        # Committed by the caller together with the file's other chunk changes
+        if new_chunks:
+            self.db.add_all(new_chunks)
+
+    def _download_chunk_part(self, file_id: str, part_number: int, url_info: Dict) -> Tuple[int, int]:
+        """
+        Download one chunk into the file's packed chunk file; runs on a download worker
+
+        Args:
+            file_id: ID of the file
+            part_number: Part number of the chunk (starting at 1)
+            url_info: Download URL entry for the chunk, with its presigned_url and byte range
+
+        Returns:
+            Tuple[int, int]: Offset and length of the chunk in the packed chunk file
+        """
+        # Chunks sit at the same offsets in the packed chunk file as in the original file.
+        # Only the server knows the chunk size the file was uploaded with, so a part without
+        # its byte range can't be placed
+        chunk_offset = url_info.get('start_byte')
+        if chunk_offset is None:
+            raise ValueError(f"No byte range returned for part {part_number} of file {file_id}")
+
+        # The presigned URL covers the whole object; the Range header selects this chunk
+        headers = {'Range': url_info['range_header']} if url_info.get('range_header') else None
+
+        # Stream the body straight to disk instead of holding the whole chunk in memory
+        with self.api_client.session.get(url_info['presigned_url'], headers=headers,
+                                         stream=True, timeout=60) as response:
+            response.raise_for_status()
+            chunk_length = self._write_packed_chunk(
+                file_id, chunk_offset, response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE)
+            )
+        return chunk_offset, chunk_length
+
     def process_sync_response(self, sync_response):
         """
         Process the sync response from the server
@@ -865,16 +1640,14 @@ class SyncEngine:
         Returns:
             bool: True if sync was successful, False otherwise
         """
-        from server.client import FileServiceClient
-        import requests
 
         if not sync_response:
-            print("Error: Invalid sync response")
+            logger.error("Invalid sync response")
             return False
 
         # Check if we're already up to date
         if sync_response.get('up_to_date', False):
-            print("Already up to date with server")
+            logger.info("Already up to date with server")
 
             # Update system_last_sync_time in the System table
             try:
@@ -882,17 +1655,25 @@ class SyncEngine:
                 if system_record:
                     system_record.system_last_sync_time = sync_response.get('last_sync_time')
                     self.db.commit()
-                    print(f"Updated system_last_sync_time to {sync_response.get('last_sync_time')}")
+                    logger.info("Updated system_last_sync_time to %s", sync_response.get('last_sync_time'))
                 else:
-                    print("Warning: System record not found, cannot update system_last_sync_time")
+                    logger.warning("System record not found, cannot update system_last_sync_time")
             except Exception as e:
-                print(f"Error updating system_last_sync_time: {e}")
+                logger.error("Error updating system_last_sync_time: %s", e)
 
             return True
 
         # Process updated files
         updated_files = sync_response.get('updated_files', [])
-        print(f"Processing {len(updated_files)} updated files from server")
+        logger.info("Processing %s updated files from server", len(updated_files))
+
+        # Look up the local metadata of every updated file up front, a batch of paths per query
+        updated_paths = [file_info.get('file_path') for file_info in updated_files]
+        local_files_by_path = {}
+        for batch_start in range(0, len(updated_paths), SYNC_LOOKUP_BATCH_SIZE):
+            batch_paths = updated_paths[batch_start:batch_start + SYNC_LOOKUP_BATCH_SIZE]
+            for local_file in self.db.query(FilesMetaData).filter(FilesMetaData.file_path.in_(batch_paths)):
+                local_files_by_path[local_file.file_path] = local_file
 
         for file_info in updated_files:
             file_id = file_info.get('file_id')
@@ -902,10 +1683,10 @@ class SyncEngine:
             folder_id = file_info.get('folder_id')
             chunks = file_info.get('chunks', [])
 
-            print(f"Processing file: {file_path} with {len(chunks)} updated chunks")
+            logger.debug("Processing file: %s with %s updated chunks", file_path, len(chunks))
 
             # First try to find the file by path (most reliable)
-            local_file = self.db.query(FilesMetaData).filter(FilesMetaData.file_path == file_path).first()
+            local_file = local_files_by_path.get(file_path)
 
             # If not found by path, try by file_id as fallback
             if not local_file:
@@ -913,7 +1694,7 @@ class SyncEngine:
 
             if not local_file:
                 # Create new file metadata
-                print(f"Creating new file metadata for {file_path}")
+                logger.info("Creating new file metadata for %s", file_path)
                 local_file = FilesMetaData(
                     file_id=file_id,
                     file_type=file_type,
@@ -923,133 +1704,104 @@ class SyncEngine:
                 )
                 self.db.add(local_file)
                 self.db.commit()
+                local_files_by_path[file_path] = local_file
 
                 # Ensure parent directories exist
                 parent_dir = os.path.dirname(file_path)
                 self.ensure_parent_directories(parent_dir)
             else:
                 # File already exists, no need to update metadata
-                print(f"File metadata already exists for {file_path}")
-
-            # Process chunks
+                logger.debug("File metadata already exists for %s", file_path)
+
+            # Index the file's local chunks once instead of querying for every chunk
+            local_chunks_by_part = {}
+            local_chunks_by_id = {}
+            for local_chunk in self.db.query(Chunks).filter(Chunks.file_id == file_id):
+                local_chunks_by_part[local_chunk.part_number] = local_chunk
+                local_chunks_by_id[local_chunk.chunk_id] = local_chunk
+
+            # Process chunks, collecting the ones that have to be downloaded
+            chunks_to_download = []
+            stale_chunk_count = 0
             for chunk_info in chunks:
                 chunk_id = chunk_info.get('chunk_id')
                 part_number = chunk_info.get('part_number')
                 fingerprint = chunk_info.get('fingerprint')
                 created_at = chunk_info.get('created_at')
 
+                # Fingerprints are hex on the wire and raw digests locally
+                try:
+                    fingerprint_digest = bytes.fromhex(fingerprint)
+                except (TypeError, ValueError):
+                    logger.warning("Invalid fingerprint for chunk %s: %s", chunk_id, fingerprint)
+                    continue
+
                 # First, try to find the chunk by file_id and part_number (most reliable)
-                local_chunk = self.db.query(Chunks).filter(
-                    Chunks.file_id == file_id,
-                    Chunks.part_number == part_number
-                ).first()
+                local_chunk = local_chunks_by_part.get(part_number)
 
                 # If not found by part_number, try by chunk_id as fallback
                 if not local_chunk:
-                    local_chunk = self.db.query(Chunks).filter(
-                        Chunks.chunk_id == chunk_id,
-                        Chunks.file_id == file_id
-                    ).first()
+                    local_chunk = local_chunks_by_id.get(chunk_id)
 
                 if local_chunk:
                     # Check if fingerprint matches (this is the key comparison)
-                    if local_chunk.fingerprint == fingerprint:
-                        print(f"Chunk for file {file_id}, part {part_number} already exists with matching fingerprint")
+                    if local_chunk.fingerprint == fingerprint_digest:
+                        logger.debug("Chunk for file %s, part %s already exists with matching fingerprint", file_id, part_number)
                         continue
                     else:
-                        print(f"Chunk for file {file_id}, part {part_number} exists but fingerprint has changed, downloading new version")
-                        # Delete existing chunk
+                        logger.debug("Chunk for file %s, part %s exists but fingerprint has changed, downloading new version", file_id, part_number)
+                        # Delete existing chunk; committed with the file's downloaded chunks
                         self.db.delete(local_chunk)
-                        self.db.commit()
-
-                # Download chunk from server
-                print(f"Downloading chunk {chunk_id} for file {file_id}")
-
-                # Create a download request for this chunk
-                api_client = FileServiceClient()
-                download_request = {
-                    "file_id": file_id,
-                    "chunks": [
-                        {
-                            "chunk_id": chunk_id,
-                            "part_number": part_number,
-                            "fingerprint": fingerprint
-                        }
-                    ]
-                }
-
-                try:
-                    # Call the download endpoint
-                    download_response = api_client._make_request("POST", "/files/download", download_request)
-
-                    if not download_response.get('success', False):
-                        print(f"Error downloading chunk {chunk_id}: {download_response.get('error_message')}")
-                        continue
-
-                    # Get the download URL
-                    download_urls = download_response.get('download_urls', [])
-                    if not download_urls:
-                        print(f"No download URLs returned for chunk {chunk_id}")
-                        continue
-
-                    download_url = download_urls[0].get('presigned_url')
-
-                    # Download the chunk
-                    response = requests.get(download_url, timeout=60)
-                    response.raise_for_status()
-
-                    # Save the chunk to the chunk directory
-                    chunk_path = os.path.join(CHUNK_DIR, f"{chunk_id}.chunk")
-                    with open(chunk_path, 'wb') as f:
-                        f.write(response.content)
-
-                    # Create chunk metadata
-                    new_chunk = Chunks(
-                        chunk_id=chunk_id,
-                        file_id=file_id,
-                        part_number=part_number,
-                        created_at=datetime.fromisoformat(created_at.replace('Z', '+00:00')),
-                        last_synced=datetime.now(timezone.utc),
-                        fingerprint=fingerprint
-                    )
-                    self.db.add(new_chunk)
-                    self.db.commit()
-
-                    print(f"Successfully downloaded and saved chunk {chunk_id}")
-
-                except Exception as e:
-                    print(f"Error downloading chunk {chunk_id}: {e}")
-                    continue
+                        stale_chunk_count += 1
+                        local_chunks_by_part.pop(local_chunk.part_number, None)
+                        local_chunks_by_id.pop(local_chunk.chunk_id, None)
+
+                chunks_to_download.append({
+                    'chunk_id': chunk_id,
+                    'part_number': part_number,
+                    'fingerprint': fingerprint,
+                    'fingerprint_digest': fingerprint_digest,
+                    'created_at': created_at
+                })
+
+            # Stale rows must be gone before replacement rows with the same key are inserted
+            if stale_chunk_count:
+                self.db.flush()
+
+            # Download chunks from server
+            if chunks_to_download:
+                self._download_chunks(file_id, chunks_to_download)
+
+            # One transaction per file for its deleted and downloaded chunks
+            self.db.commit()
 
             # Check if we need to reconstruct the file
-            local_chunks = self.db.query(Chunks).filter(Chunks.file_id == file_id).all()
+            # Chunks come back in part order straight from the (file_id, part_number) index
+            local_chunks = self.db.query(Chunks).filter(Chunks.file_id == file_id).order_by(Chunks.part_number).all()
             if local_chunks:
                 # Reconstruct the file
-                print(f"Reconstructing file {file_path}")
+                logger.info("Reconstructing file %s", file_path)
 
                 # Ensure the directory exists
                 os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-                # Reconstruct the file from chunks
-                with open(file_path, 'wb') as f:
-                    # Sort chunks by part_number to ensure correct order
-                    for chunk in sorted(local_chunks, key=lambda x: x.part_number):
-                        chunk_path = os.path.join(CHUNK_DIR, f"{chunk.chunk_id}.chunk")
-                        if os.path.exists(chunk_path):
-                            with open(chunk_path, 'rb') as chunk_file:
-                                f.write(chunk_file.read())
-                        else:
-                            print(f"Warning: Chunk not found at {chunk_path}")
-                            # Try alternative path format as fallback
-                            alt_chunk_path = os.path.join(CHUNK_DIR, f"{file_id}_{chunk.part_number-1}.chunk")
-                            if os.path.exists(alt_chunk_path):
-                                print(f"Found chunk at alternative path: {alt_chunk_path}")
-                                with open(alt_chunk_path, 'rb') as chunk_file:
-                                    f.write(chunk_file.read())
-                            else:
-                                print(f"Warning: Chunk not found at alternative path {alt_chunk_path} either")
-
-                print(f"Successfully reconstructed file {file_path}")
+                # Reconstruct the file from the packed chunk file
+                chunk_path = self._packed_chunk_path(file_id)
+                try:
+                    packed_file = open(chunk_path, 'rb')
+                except FileNotFoundError:
+                    logger.warning("Chunk file not found at %s", chunk_path)
+                    continue
+
+                with packed_file, open(file_path, 'wb') as f:
+                    self._advise_sequential(packed_file)
+                    for chunk in local_chunks:
+                        if chunk.chunk_offset is None or chunk.chunk_length is None:
+                            logger.warning("No location recorded for chunk %s", chunk.chunk_id)
+                            continue
+                        self._copy_chunk_into(f, packed_file, chunk.chunk_offset, chunk.chunk_length)
+
+                logger.info("Successfully reconstructed file %s", file_path)
 
         # Update system_last_sync_time in the System table
         try:
@@ -1057,10 +1809,10 @@ class SyncEngine:
             if system_record:
                 system_record.system_last_sync_time = sync_response.get('last_sync_time')
                 self.db.commit()
-                print(f"Updated system_last_sync_time to {sync_response.get('last_sync_time')}")
+                logger.info("Updated system_last_sync_time to %s", sync_response.get('last_sync_time'))
             else:
-                print("Warning: System record not found, cannot update system_last_sync_time")
+                logger.warning("System record not found, cannot update system_last_sync_time")
         except Exception as e:
-            print(f"Error updating system_last_sync_time: {e}")
+            logger.error("Error updating system_last_sync_time: %s", e)
 
         return True
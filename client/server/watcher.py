@@ -1,11 +1,44 @@
 import pyinotify
+import logging
 import os
-import uuid
+import queue
+import re
+import sys
+import threading
+import time
+from sqlalchemy import insert, or_, select
+from sqlalchemy.orm import scoped_session
 from db.engine import SessionLocal
 from db.models import FilesMetaData, Chunks, Folders
-from server.sync import SyncEngine
-from typing import Callable
-from config import SYNC_DIR
+from server.sync import SyncEngine, new_id, split_file_path, subtree_filter
+from server.client import get_file_service_client
+from typing import Callable, Dict, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from config import SYNC_DIR, WATCHER_DEBOUNCE_SECONDS, WATCHER_FILE_CONCURRENCY, WATCHER_NICE
+
+logger = logging.getLogger(__name__)
+
+# Directories below the sync directory that never get a watch: hidden ones, which scans
+# skip too, so nothing is synced from a directory whose changes wouldn't be seen
+EXCLUDED_WATCH_PATTERNS = (r"/(?:.*/)?\.",)
+
+# Seconds an IN_MOVED_FROM waits for its IN_MOVED_TO before it counts as a move out of the tree
+MOVE_COOKIE_TTL = 0.2
+
+# Number of watched directories above which a warning about the tree's size is logged
+WATCH_COUNT_WARNING = 8192
+
+# Events that only say a file's content changed; a run of them for one path needs one upload
+CONTENT_EVENTS = ('create', 'modify')
+
+# How a new event for a path combines with the content event still pending for it
+# (pending, new) -> event to keep; None drops both, as a file created and deleted within
+# one quiet period never needs syncing
+COALESCED_EVENTS = {
+    ('create', 'modify'): 'create',
+    ('create', 'delete'): None,
+    ('modify', 'delete'): 'delete',
+}
 
 class EventHandler(pyinotify.ProcessEvent):
     def __init__(self, sync_dir: str, callback: Callable = None):
@@ -18,8 +51,45 @@ class EventHandler(pyinotify.ProcessEvent):
         """
         self.sync_dir = sync_dir
         self.callback = callback
+
+        # Sources of IN_MOVED_FROM events waiting for the IN_MOVED_TO with the same cookie:
+        # cookie -> (path, is_dir, time seen)
+        self.move_cookies = {}
+
+        # Held while the notifier thread handles an event and while the event worker expires
+        # move cookies, so their callbacks reach the event queue in order
+        self.event_lock = threading.Lock()
         super().__init__()
 
+    def __call__(self, event):
+        with self.event_lock:
+            return super().__call__(event)
+
+    def expire_move_cookies(self):
+        """
+        Treat unpaired moves as deletions without waiting for another inotify event; called
+        on the event worker, as a move out of the tree may be the last event for a while
+        """
+        with self.event_lock:
+            self._expire_move_cookies()
+
+    def _expire_move_cookies(self):
+        """
+        Treat moves whose IN_MOVED_TO never arrived as deletions
+
+        The kernel queues both halves of a move within the sync directory back to back, so a
+        source still unpaired after MOVE_COOKIE_TTL was moved out of the watched tree.
+        """
+        if not self.move_cookies:
+            return
+        expired_before = time.monotonic() - MOVE_COOKIE_TTL
+        for cookie, (path, is_dir, seen_at) in list(self.move_cookies.items()):
+            if seen_at < expired_before:
+                del self.move_cookies[cookie]
+                logger.debug("Moved out of the sync directory: %s", path)
+                if self.callback:
+                    self.callback('delete_dir' if is_dir else 'delete', path)
+
     def process_IN_CREATE(self, event):
         """
         Handle file or directory creation events
@@ -27,12 +97,14 @@ class EventHandler(pyinotify.ProcessEvent):
         Args:
             event: Inotify event
         """
+        self._expire_move_cookies()
+
         if event.dir:
-            print(f"Directory created: {event.pathname}")
+            logger.debug("Directory created: %s", event.pathname)
             if self.callback:
                 self.callback('create_dir', event.pathname)
         else:
-            print(f"File created: {event.pathname}")
+            logger.debug("File created: %s", event.pathname)
             if self.callback:
                 self.callback('create', event.pathname)
 
@@ -43,8 +115,10 @@ class EventHandler(pyinotify.ProcessEvent):
         Args:
             event: Inotify event
         """
+        self._expire_move_cookies()
+
         if not event.dir:  # Directories don't have content to modify
-            print(f"File modified: {event.pathname}")
+            logger.debug("File modified: %s", event.pathname)
             if self.callback:
                 self.callback('modify', event.pathname)
 
@@ -55,12 +129,14 @@ class EventHandler(pyinotify.ProcessEvent):
         Args:
             event: Inotify event
         """
+        self._expire_move_cookies()
+
         if event.dir:
-            print(f"Directory deleted: {event.pathname}")
+            logger.debug("Directory deleted: %s", event.pathname)
             if self.callback:
                 self.callback('delete_dir', event.pathname)
         else:
-            print(f"File deleted: {event.pathname}")
+            logger.debug("File deleted: %s", event.pathname)
             if self.callback:
                 self.callback('delete', event.pathname)
 
@@ -71,19 +147,19 @@ class EventHandler(pyinotify.ProcessEvent):
         Args:
             event: Inotify event
         """
+        self._expire_move_cookies()
+
         # Store the source path for later use in process_IN_MOVED_TO
         if hasattr(event, 'cookie'):
             # Store the path with the cookie as the key
-            if not hasattr(self, 'move_cookies'):
-                self.move_cookies = {}
-            self.move_cookies[event.cookie] = event.pathname
+            self.move_cookies[event.cookie] = (event.pathname, event.dir, time.monotonic())
 
         if event.dir:
-            print(f"Directory moved from: {event.pathname}")
+            logger.debug("Directory moved from: %s", event.pathname)
             if self.callback:
                 self.callback('move_from_dir', event.pathname)
         else:
-            print(f"File moved from: {event.pathname}")
+            logger.debug("File moved from: %s", event.pathname)
             if self.callback:
                 self.callback('move_from', event.pathname)
 
@@ -96,30 +172,102 @@ class EventHandler(pyinotify.ProcessEvent):
         """
         # Get the source path if available
         source_path = None
-        if hasattr(event, 'cookie') and hasattr(self, 'move_cookies') and event.cookie in self.move_cookies:
-            source_path = self.move_cookies[event.cookie]
+        if hasattr(event, 'cookie') and event.cookie in self.move_cookies:
             # Remove the cookie after use
-            del self.move_cookies[event.cookie]
+            source_path = self.move_cookies.pop(event.cookie)[0]
+        self._expire_move_cookies()
 
         if event.dir:
-            print(f"Directory moved to: {event.pathname}")
+            logger.debug("Directory moved to: %s", event.pathname)
             if source_path:
-                print(f"This is a rename/move operation from {source_path} to {event.pathname}")
+                logger.debug("This is a rename/move operation from %s to %s", source_path, event.pathname)
                 if self.callback:
                     self.callback('rename_dir', (source_path, event.pathname))
             else:
                 if self.callback:
                     self.callback('move_to_dir', event.pathname)
         else:
-            print(f"File moved to: {event.pathname}")
+            logger.debug("File moved to: %s", event.pathname)
             if source_path:
-                print(f"This is a rename/move operation from {source_path} to {event.pathname}")
+                logger.debug("This is a rename/move operation from %s to %s", source_path, event.pathname)
                 if self.callback:
                     self.callback('rename_file', (source_path, event.pathname))
             else:
                 if self.callback:
                     self.callback('move_to', event.pathname)
 
+def _lower_thread_priority():
+    """
+    Run the calling thread, and any threads it starts later, at WATCHER_NICE on Linux
+
+    Linux keeps a nice value per thread, so this leaves the API server's threads alone.
+    """
+    if not WATCHER_NICE or not sys.platform.startswith('linux'):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), WATCHER_NICE)
+    except OSError as e:
+        logger.debug("Could not lower thread priority: %s", e)
+
+def _iter_tree(root: str) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory tree with os.scandir, skipping hidden files and directories
+
+    Hidden directories are pruned, so nothing beneath them is visited, and every directory
+    is yielded before anything inside it. Entries carry their file type from the directory
+    listing, so telling files from directories costs no extra stat. As with os.walk, a
+    symlink to a directory counts as a directory (entry.is_dir()) but isn't descended into.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        os.DirEntry: Every file and directory below root
+    """
+    pending_dirs = [root]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir() and not entry.is_symlink():
+                    pending_dirs.append(entry.path)
+                yield entry
+
+class PendingEvent:
+    def __init__(self, event_type: str):
+        """
+        A debounced content event waiting for its path to go quiet
+
+        Args:
+            event_type: Type of event to queue (create or modify)
+        """
+        self.event_type = event_type
+        self.last_seen = time.monotonic()
+        self.timer = None
+
+class LockingNotifier(pyinotify.ThreadedNotifier):
+    def __init__(self, watch_manager: pyinotify.WatchManager, default_proc_fun: Callable,
+                 watch_lock: threading.Lock):
+        """
+        A ThreadedNotifier that processes events while holding a lock on its WatchManager
+
+        pyinotify doesn't lock the WatchManager, so an event processed while another thread
+        is adding a watch could miss the watch's entry and be dropped. Watches added from
+        other threads must hold watch_lock too.
+
+        Args:
+            watch_manager: Watch manager whose watches the events belong to
+            default_proc_fun: Handler for the events
+            watch_lock: Lock held around every change to the watch manager's watches
+        """
+        super().__init__(watch_manager, default_proc_fun)
+        self.watch_lock = watch_lock
+
+    def process_events(self):
+        with self.watch_lock:
+            super().process_events()
+
 class Watcher:
     def __init__(self, sync_dir: str = SYNC_DIR):
         """
@@ -129,12 +277,34 @@ class Watcher:
             sync_dir: Directory to watch (defaults to SYNC_DIR from config)
         """
         self.sync_dir = sync_dir
+        self.api_client = get_file_service_client()
         self.wm = pyinotify.WatchManager()
-        self.handler = EventHandler(sync_dir, self.handle_event)
+        self.watch_mask = (pyinotify.IN_CREATE | pyinotify.IN_MODIFY | pyinotify.IN_DELETE |
+                           pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO)
+        self.exclude_filter = pyinotify.ExcludeFilter(
+            [re.escape(self.sync_dir) + pattern for pattern in EXCLUDED_WATCH_PATTERNS])
+        self.watch_lock = threading.Lock()
+        self.handler = EventHandler(sync_dir, self.queue_event)
         self.notifier = None
         self.thread = None
         self.running = False
 
+        # Events are applied on a worker thread so the notifier thread only ever reads
+        # inotify; a slow upload then can't let the kernel's event queue overflow
+        # SimpleQueue is a C deque with no task tracking, so a put from the notifier thread
+        # never contends for the worker's lock; content bursts are already collapsed per path
+        # before they get here, which keeps the queue's length bounded by distinct changes
+        self.event_queue = queue.SimpleQueue()
+
+        # One session and SyncEngine per thread, reused for every event that thread handles
+        # so the engine's folder cache carries over from one event to the next
+        self.Session = scoped_session(SessionLocal)
+        self._thread_state = threading.local()
+
+        # Content events not queued yet, keyed by path
+        self.pending_events = {}
+        self.pending_lock = threading.Lock()
+
     def start(self):
         """
         Start watching the directory and scan existing files
@@ -145,31 +315,67 @@ class Watcher:
         # Create directory if it doesn't exist
         os.makedirs(self.sync_dir, exist_ok=True)
 
-        # Scan existing files in the sync directory
-        self.scan_existing_files()
+        # Scan existing files in the sync directory on a low-priority thread of its own, so
+        # the priority change doesn't stick to the caller
+        scan_thread = threading.Thread(target=self._scan_at_low_priority, name="watcher-scan")
+        scan_thread.start()
+        scan_thread.join()
 
-        # Set up inotify
-        mask = pyinotify.IN_CREATE | pyinotify.IN_MODIFY | pyinotify.IN_DELETE | pyinotify.IN_MOVED_FROM | pyinotify.IN_MOVED_TO
-        self.notifier = pyinotify.ThreadedNotifier(self.wm, self.handler)
-        self.wm.add_watch(self.sync_dir, mask, rec=True, auto_add=True)
+        # Start applying queued events
+        self.thread = threading.Thread(target=self._consume_events, name="watcher-events", daemon=True)
+        self.thread.start()
+
+        # Set up inotify; directories created or moved in later are watched by the events
+        # worker (see _watch_new_directory) rather than by pyinotify on the notifier thread
+        self.notifier = LockingNotifier(self.wm, self.handler, self.watch_lock)
+        self.wm.add_watch(self.sync_dir, self.watch_mask, rec=True, auto_add=False,
+                          exclude_filter=self.exclude_filter)
+
+        # Every watched directory costs a kernel watch and wakes the notifier for its events
+        watch_count = len(self.wm.watches)
+        if watch_count > WATCH_COUNT_WARNING:
+            logger.warning("Watching %s directories under %s; check fs.inotify.max_user_watches",
+                           watch_count, self.sync_dir)
 
         # Start the notifier
         self.notifier.start()
         self.running = True
-        print(f"Started watching directory: {self.sync_dir}")
+        logger.info("Started watching directory: %s", self.sync_dir)
+
+    def _watch_new_directory(self, path: str):
+        """
+        Watch a directory created in or moved into the sync directory, and every directory below it
+
+        Called on the events worker before the directory is scanned: anything created in it
+        before the watch exists is found by the scan, and anything after reaches the watch.
+        The notifier doesn't process events while the watch is being added (see LockingNotifier).
+
+        Args:
+            path: Path of the new directory
+        """
+        with self.watch_lock:
+            self.wm.add_watch(path, self.watch_mask, rec=True, auto_add=False,
+                              exclude_filter=self.exclude_filter)
+
+    def _scan_at_low_priority(self):
+        """
+        Scan existing files after lowering the calling thread's priority
+        """
+        _lower_thread_priority()
+        self.scan_existing_files()
 
     def scan_existing_files(self):
         """
         Scan existing files in the sync directory and process them
         Also clean up any orphaned chunks
         """
-        print(f"Scanning existing files in: {self.sync_dir}")
+        logger.info("Scanning existing files in: %s", self.sync_dir)
 
         # Get a new database session
         db = SessionLocal()
         try:
             # Create sync engine
-            sync_engine = SyncEngine(db, self.sync_dir)
+            sync_engine = SyncEngine(db, self.sync_dir, self.api_client)
 
             # Scan the sync directory
             sync_engine.scan_sync_directory()
@@ -187,10 +393,174 @@ class Watcher:
         if not self.running:
             return
 
-        # Stop the notifier
+        # Stop the notifier, then let the worker finish the events already queued
         self.notifier.stop()
+        self._flush_pending_events()
+        self.event_queue.put(None)
+        self.thread.join()
         self.running = False
-        print(f"Stopped watching directory: {self.sync_dir}")
+        logger.info("Stopped watching directory: %s", self.sync_dir)
+
+    def queue_event(self, event_type: str, path):
+        """
+        Queue a file or directory event for the event worker; called on the notifier thread,
+        or on the event worker for moves out of the tree
+
+        Args:
+            event_type: Type of event (see handle_event)
+            path: Path to the file or directory, or (old_path, new_path) for renames
+        """
+        if event_type in CONTENT_EVENTS or event_type == 'delete':
+            with self.pending_lock:
+                pending = self.pending_events.get(path)
+                if pending and event_type in CONTENT_EVENTS:
+                    # Part of a burst: just note the time; the timer checks it before queuing
+                    pending.event_type = COALESCED_EVENTS.get((pending.event_type, event_type), event_type)
+                    pending.last_seen = time.monotonic()
+                    return
+
+                if pending:
+                    # Fold the delete into the pending content event
+                    del self.pending_events[path]
+                    pending.timer.cancel()
+                    event_type = COALESCED_EVENTS.get((pending.event_type, event_type), event_type)
+                    if event_type is None:
+                        return
+
+                if event_type in CONTENT_EVENTS and WATCHER_DEBOUNCE_SECONDS > 0:
+                    # Start the path's quiet period; only the last event of a burst is queued
+                    pending = PendingEvent(event_type)
+                    self.pending_events[path] = pending
+                    self._start_debounce_timer(path, pending, WATCHER_DEBOUNCE_SECONDS)
+                    return
+
+        # Anything else may depend on earlier content changes (a rename or delete of the
+        # same file or its folder), so those are queued first to keep the order
+        self._flush_pending_events()
+        self.event_queue.put((event_type, path))
+
+    def _start_debounce_timer(self, path: str, pending: 'PendingEvent', delay: float):
+        """
+        Start the timer that queues a pending content event; called with pending_lock held
+
+        Args:
+            path: Path to the file
+            pending: The path's pending content event
+            delay: Seconds to wait
+        """
+        pending.timer = threading.Timer(delay, self._queue_debounced_event, args=(path, pending))
+        pending.timer.daemon = True
+        pending.timer.start()
+
+    def _queue_debounced_event(self, path: str, pending: 'PendingEvent'):
+        """
+        Queue a content event once its path has been quiet for the debounce delay; runs on
+        the timer thread
+
+        Args:
+            path: Path to the file
+            pending: The path's pending content event when the timer was started
+        """
+        with self.pending_lock:
+            # A delete or a flush may have taken over this event
+            if self.pending_events.get(path) is not pending:
+                return
+
+            # Events arrived while waiting: wait out the rest of the quiet period
+            remaining = pending.last_seen + WATCHER_DEBOUNCE_SECONDS - time.monotonic()
+            if remaining > 0:
+                self._start_debounce_timer(path, pending, remaining)
+                return
+
+            del self.pending_events[path]
+            self.event_queue.put((pending.event_type, path))
+
+    def _flush_pending_events(self):
+        """
+        Queue every debounced content event now instead of waiting for its timer
+        """
+        with self.pending_lock:
+            for path, pending in self.pending_events.items():
+                pending.timer.cancel()
+                self.event_queue.put((pending.event_type, path))
+            self.pending_events.clear()
+
+    def _consume_events(self):
+        """
+        Apply queued events in order until stop() queues the None sentinel
+
+        Events already waiting are taken together, and a run of consecutive content
+        events for the same file (such as the IN_MODIFY burst of one save) is applied once.
+        """
+        _lower_thread_priority()
+        while True:
+            self.handler.expire_move_cookies()
+            try:
+                events = [self.event_queue.get(timeout=MOVE_COOKIE_TTL)]
+            except queue.Empty:
+                continue
+            while True:
+                try:
+                    events.append(self.event_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for index, event in enumerate(events):
+                if event is None:
+                    self._thread_state.sync_engine = None
+                    self.Session.remove()
+                    return
+
+                event_type, path = event
+                if event_type in CONTENT_EVENTS and index + 1 < len(events):
+                    next_event = events[index + 1]
+                    if next_event is not None and next_event[0] in CONTENT_EVENTS and next_event[1] == path:
+                        continue
+
+                try:
+                    self.handle_event(event_type, path)
+                except Exception:
+                    logger.exception("Error handling %s event for %s", event_type, path)
+
+    def _get_sync_engine(self, db) -> SyncEngine:
+        """
+        Get the calling thread's sync engine, creating it for the thread's session if needed
+
+        A new engine starts with the whole folder table in its folder cache; events keep the
+        cache up to date from then on.
+
+        Args:
+            db: The calling thread's database session
+
+        Returns:
+            SyncEngine: Sync engine bound to db
+        """
+        sync_engine = getattr(self._thread_state, 'sync_engine', None)
+        if sync_engine is None or sync_engine.db is not db:
+            sync_engine = SyncEngine(db, self.sync_dir, self.api_client)
+            # Start from every tracked folder so events rarely need a folder query
+            sync_engine._load_folder_cache()
+            self._thread_state.sync_engine = sync_engine
+        return sync_engine
+
+    def _chunk_new_file(self, file_path: str, file_id: str, file_values: Dict):
+        """
+        Chunk and upload a file whose row is already committed; runs on a chunk worker
+        with a session of its own
+
+        Args:
+            file_path: Path to the file
+            file_id: ID of the file
+            file_values: Columns of the file's row to write once the upload is confirmed,
+                         including folder_id, file_hash, mtime_ns and file_size
+        """
+        db = SessionLocal()
+        try:
+            SyncEngine(db, self.sync_dir, self.api_client)._process_file_chunks(
+                file_path, file_id, file_values=file_values)
+            db.commit()
+        finally:
+            db.close()
 
     def handle_event(self, event_type: str, path: str):
         """
@@ -201,43 +571,49 @@ class Watcher:
                         create_dir, delete_dir, move_from_dir, move_to_dir)
             path: Path to the file or directory
         """
-        # Get a new database session
-        db = SessionLocal()
+        # Reuse this thread's database session and sync engine
+        db = self.Session()
+        sync_engine = self._get_sync_engine(db)
         try:
-            # Create sync engine
-            sync_engine = SyncEngine(db, self.sync_dir)
 
             # Handle event based on type
             if event_type in ['create', 'modify']:
                 # Upload file
                 file_id = sync_engine.upload_file(path)
-                print(f"Uploaded file: {path} with ID: {file_id}")
+                logger.debug("Uploaded file: %s with ID: %s", path, file_id)
 
             elif event_type == 'create_dir':
                 # Skip if this is the sync directory itself
                 if path == self.sync_dir:
                     return
 
+                self._watch_new_directory(path)
+
                 # Create directory entry and ensure parent directories exist
                 folder_id = sync_engine._ensure_folder_tree(path)
-                print(f"Added directory to database: {path} with ID: {folder_id}")
-
-                # Scan the directory for any existing files
-                print(f"Scanning new directory: {path}")
-                for root, _, files in os.walk(path):
-                    for filename in files:
-                        file_path = os.path.join(root, filename)
-
-                        # Skip hidden files
-                        if filename.startswith('.'):
-                            continue
-
-                        try:
-                            # Process the file
-                            file_id = sync_engine.upload_file(file_path)
-                            print(f"Processed file in new directory: {file_path} with ID: {file_id}")
-                        except Exception as e:
-                            print(f"Error processing file {file_path}: {e}")
+                logger.debug("Added directory to database: %s with ID: %s", path, folder_id)
+
+                # Scan the directory for anything created before its watch was added
+                logger.debug("Scanning new directory: %s", path)
+                dir_paths = []
+                file_entries = []
+                for entry in _iter_tree(path):
+                    if entry.is_dir():
+                        dir_paths.append(entry.path)
+                    else:
+                        file_entries.append(entry)
+
+                # Add every subdirectory, including empty ones, with one lookup and one insert;
+                # parents are listed before their children
+                sync_engine._create_folders_bulk(sync_engine._cache_folder_ids(dir_paths))
+
+                for entry in file_entries:
+                    try:
+                        # Process the file
+                        file_id = sync_engine.upload_file(entry.path, entry.stat())
+                        logger.debug("Processed file in new directory: %s with ID: %s", entry.path, file_id)
+                    except Exception as e:
+                        logger.error("Error processing file %s: %s", entry.path, e)
 
             elif event_type == 'delete':
                 # Delete file entry and its chunks
@@ -246,54 +622,53 @@ class Watcher:
                 ).first()
 
                 if file_metadata:
-                    # Delete chunks
-                    db.query(Chunks).filter(Chunks.file_id == file_metadata.file_id).delete()
-                    # Delete file metadata
-                    db.delete(file_metadata)
+                    file_id = file_metadata.file_id
+                    # Delete chunks and file metadata with one statement each
+                    db.query(Chunks).filter(Chunks.file_id == file_id).delete(synchronize_session=False)
+                    db.query(FilesMetaData).filter(FilesMetaData.file_id == file_id).delete(synchronize_session=False)
                     db.commit()
-                    print(f"Deleted file from database: {path}")
+                    logger.debug("Deleted file from database: %s", path)
 
-                    # Clean up orphaned chunks
-                    sync_engine.cleanup_orphaned_chunks()
+                    # Remove the file's packed chunk file instead of scanning the chunk directory
+                    sync_engine.remove_packed_chunk_files([file_id])
 
             elif event_type == 'delete_dir':
                 # Delete directory entry and all its contents
-                folder = db.query(Folders).filter(
-                    Folders.folder_path == path
-                ).first()
-
-                if folder:
-                    # Get all files in this folder and its subfolders
-                    files_to_delete = db.query(FilesMetaData).filter(
-                        FilesMetaData.folder_id == folder.folder_id
-                    ).all()
-
-                    # Delete chunks for all files
-                    for file in files_to_delete:
-                        db.query(Chunks).filter(Chunks.file_id == file.file_id).delete()
-                        db.delete(file)
-
-                    # Delete the folder (cascade will delete subfolders)
-                    db.delete(folder)
+                if sync_engine._find_folder_id(path):
+                    # Everything below the directory is an index range on the path columns,
+                    # so the whole subtree goes in a few bulk deletes instead of row by row
+                    files_below = subtree_filter(FilesMetaData.file_path, path)
+                    file_ids = db.execute(select(FilesMetaData.file_id).where(files_below)).scalars().all()
+                    db.query(Chunks).filter(
+                        Chunks.file_id.in_(select(FilesMetaData.file_id).where(files_below))
+                    ).delete(synchronize_session=False)
+                    db.query(FilesMetaData).filter(files_below).delete(synchronize_session=False)
+
+                    # Delete the folder and its subfolders
+                    db.query(Folders).filter(
+                        or_(Folders.folder_path == path, subtree_filter(Folders.folder_path, path))
+                    ).delete(synchronize_session=False)
                     db.commit()
-                    print(f"Deleted directory and its contents from database: {path}")
+                    sync_engine._invalidate_folder_cache(path)
+                    logger.debug("Deleted directory and its contents from database: %s", path)
 
-                    # Clean up orphaned chunks
-                    sync_engine.cleanup_orphaned_chunks()
+                    # Remove the deleted files' packed chunk files instead of scanning the chunk directory
+                    sync_engine.remove_packed_chunk_files(file_ids)
 
             elif event_type == 'move_to_dir':
                 # Handle directory moved to the sync directory
-                print(f"Handling directory moved to sync directory: {path}")
+                logger.debug("Handling directory moved to sync directory: %s", path)
+                self._watch_new_directory(path)
 
                 # Special handling for top-level directories moved directly to the sync directory
                 if os.path.dirname(path) == sync_engine.sync_dir:
-                    print(f"Top-level directory moved to sync directory, setting parent to root folder")
+                    logger.debug("Top-level directory moved to sync directory, setting parent to root folder")
                     # Get the root folder
                     root_folder = sync_engine._get_or_create_root_folder()
 
                     # Create the folder with the root folder as parent
                     folder_name = os.path.basename(path)
-                    folder_id = str(uuid.uuid4())
+                    folder_id = new_id()
 
                     # Create folder in local database
                     folder = Folders(
@@ -305,15 +680,13 @@ class Watcher:
 
                     db.add(folder)
                     db.commit()
-                    print(f"Added top-level moved directory to database: {path} with ID: {folder_id}")
+                    sync_engine._folder_cache[path] = folder_id
+                    logger.debug("Added top-level moved directory to database: %s with ID: %s", path, folder_id)
 
                     # Sync folder with server
                     try:
-                        from server.client import FileServiceClient
-                        api_client = FileServiceClient()
-
                         # Send folder information to server
-                        response = api_client.create_folder(
+                        response = self.api_client.create_folder(
                             folder_id=folder_id,
                             folder_path=path,
                             folder_name=folder_name,
@@ -321,160 +694,151 @@ class Watcher:
                         )
 
                         if response.get('success'):
-                            print(f"Successfully synced folder {path} with server")
+                            logger.debug("Successfully synced folder %s with server", path)
                         else:
-                            print(f"Failed to sync folder {path} with server: {response}")
+                            logger.warning("Failed to sync folder %s with server: %s", path, response)
                     except Exception as e:
-                        print(f"Error syncing folder {path} with server: {e}")
+                        logger.error("Error syncing folder %s with server: %s", path, e)
                 else:
                     # For subdirectories, use the normal folder tree creation
                     folder_id = sync_engine._ensure_folder_tree(path)
-                    print(f"Added moved directory to database: {path} with ID: {folder_id}")
-
-                # Scan the directory for any existing files
-                print(f"Scanning moved directory: {path}")
-                for root, dirs, files in os.walk(path):
-                    # First, ensure all subdirectories are in the database
-                    for dir_name in dirs:
-                        dir_path = os.path.join(root, dir_name)
-                        subdir_folder_id = sync_engine._ensure_folder_tree(dir_path)
-                        print(f"Added subdirectory to database: {dir_path} with ID: {subdir_folder_id}")
-
-                    # Then process all files in this directory
-                    for filename in files:
-                        file_path = os.path.join(root, filename)
-
-                        # Skip hidden files
-                        if filename.startswith('.'):
-                            continue
-
+                    logger.debug("Added moved directory to database: %s with ID: %s", path, folder_id)
+
+                # Collect the moved tree in one scandir pass
+                logger.debug("Scanning moved directory: %s", path)
+                dir_paths = []
+                file_entries = []
+                for entry in _iter_tree(path):
+                    if entry.is_dir():
+                        dir_paths.append(entry.path)
+                    else:
+                        file_entries.append(entry)
+
+                # Add every subdirectory with one lookup and one insert; parents are listed
+                # before their children
+                sync_engine._create_folders_bulk(sync_engine._cache_folder_ids(dir_paths))
+
+                # Add every file row with one insert and one commit. The rows get no hash or
+                # stat until their upload is confirmed, so until then they never look up to date
+                file_rows = []
+                uploaded_values = {}
+                for entry in file_entries:
+                    try:
+                        # Stat for change tracking; a file renamed within the filesystem keeps
+                        # its inode, so a hash it had before the move is reused, otherwise the
+                        # hash is computed while chunking
+                        file_stat = entry.stat()
+                    except OSError as e:
+                        logger.error("Error processing file %s: %s", entry.path, e)
+                        continue
+
+                    file_id = new_id()
+                    file_dir, file_name, file_type = split_file_path(entry.path)
+                    folder_id = sync_engine._folder_cache[file_dir]
+                    file_rows.append({
+                        'file_id': file_id,
+                        'file_type': file_type,
+                        'file_path': entry.path,
+                        'folder_id': folder_id,
+                        'file_name': file_name,
+                        'file_hash': None,
+                        'mtime_ns': None,
+                        'file_size': None
+                    })
+                    uploaded_values[file_id] = {
+                        'folder_id': folder_id,
+                        'file_hash': sync_engine._cached_file_hash(file_stat),
+                        'mtime_ns': file_stat.st_mtime_ns,
+                        'file_size': file_stat.st_size
+                    }
+
+                if file_rows:
+                    db.execute(insert(FilesMetaData), file_rows)
+                    db.commit()
+                    logger.debug("Added %s files from moved directory to database: %s", len(file_rows), path)
+
+                # Then chunk and upload several files at once, each on its own session; a file
+                # whose upload fails keeps its row without a hash or stat, which the next scan
+                # treats as changed
+                with ThreadPoolExecutor(max_workers=WATCHER_FILE_CONCURRENCY, thread_name_prefix="watcher-chunk",
+                                        initializer=_lower_thread_priority) as chunk_pool:
+                    chunk_jobs = {
+                        chunk_pool.submit(self._chunk_new_file, file_row['file_path'], file_row['file_id'],
+                                          uploaded_values[file_row['file_id']]):
+                            file_row['file_path']
+                        for file_row in file_rows
+                    }
+                    for chunk_job in as_completed(chunk_jobs):
                         try:
-                            # Get the folder ID for this file's directory
-                            file_dir = os.path.dirname(file_path)
-                            folder = db.query(Folders).filter(Folders.folder_path == file_dir).first()
-
-                            if folder:
-                                # Calculate file hash for content tracking
-                                file_hash = sync_engine.calculate_file_hash(file_path)
-
-                                # Get file type from extension
-                                _, file_extension = os.path.splitext(filename)
-                                file_type = file_extension[1:] if file_extension else "unknown"
-
-                                # Create file metadata with the correct folder ID
-                                file_id = str(uuid.uuid4())
-                                file_metadata = FilesMetaData(
-                                    file_id=file_id,
-                                    file_type=file_type,
-                                    file_path=file_path,
-                                    folder_id=folder.folder_id,  # Use the correct folder ID
-                                    file_name=filename,
-                                    file_hash=file_hash
-                                )
-
-                                # Add to database
-                                db.add(file_metadata)
-                                db.commit()
-                                print(f"Added file to database with correct folder: {file_path} with ID: {file_id}")
-
-                                # Process file chunks
-                                sync_engine._process_file_chunks(file_path, file_id)
-                            else:
-                                # Fallback to normal upload if folder not found
-                                file_id = sync_engine.upload_file(file_path)
-                                print(f"Processed file in moved directory: {file_path} with ID: {file_id}")
+                            chunk_job.result()
                         except Exception as e:
-                            print(f"Error processing file {file_path}: {e}")
+                            logger.error("Error processing file %s: %s", chunk_jobs[chunk_job], e)
+
+            elif event_type == 'move_from_dir':
+                # The directory left this path; forget the cached folder IDs under it
+                sync_engine._invalidate_folder_cache(path)
 
             elif event_type == 'rename_file':
                 # Handle file rename/move operation
                 old_path, new_path = path  # path is a tuple (old_path, new_path)
-                print(f"Handling file rename/move from {old_path} to {new_path}")
+                logger.debug("Handling file rename/move from %s to %s", old_path, new_path)
 
                 # Update the file location in the database
                 success = sync_engine.update_file_location(old_path, new_path)
                 if success:
-                    print(f"Successfully updated file location from {old_path} to {new_path}")
+                    logger.debug("Successfully updated file location from %s to %s", old_path, new_path)
                 else:
-                    print(f"Failed to update file location, falling back to normal upload")
+                    logger.warning("Failed to update file location, falling back to normal upload")
                     # Fallback to normal upload if update fails
                     file_id = sync_engine.upload_file(new_path)
-                    print(f"Uploaded file as new: {new_path} with ID: {file_id}")
+                    logger.debug("Uploaded file as new: %s with ID: %s", new_path, file_id)
 
             elif event_type == 'rename_dir':
                 # Handle directory rename/move operation
                 old_path, new_path = path  # path is a tuple (old_path, new_path)
-                print(f"Handling directory rename/move from {old_path} to {new_path}")
+                logger.debug("Handling directory rename/move from %s to %s", old_path, new_path)
 
                 # Update the folder location in the database
                 success = sync_engine.update_folder_location(old_path, new_path)
                 if success:
-                    print(f"Successfully updated folder location from {old_path} to {new_path}")
+                    logger.debug("Successfully updated folder location from %s to %s", old_path, new_path)
                 else:
-                    print(f"Failed to update folder location, falling back to normal folder creation")
+                    logger.warning("Failed to update folder location, falling back to normal folder creation")
                     # Fallback to normal folder creation if update fails
                     folder_id = sync_engine._ensure_folder_tree(new_path)
-                    print(f"Created folder as new: {new_path} with ID: {folder_id}")
+                    logger.debug("Created folder as new: %s with ID: %s", new_path, folder_id)
 
                     # Scan the directory for any existing files
-                    print(f"Scanning directory: {new_path}")
-                    for root, dirs, files in os.walk(new_path):
-                        for filename in files:
-                            file_path = os.path.join(root, filename)
-
-                            # Skip hidden files
-                            if filename.startswith('.'):
-                                continue
-
-                            try:
-                                # Process the file
-                                file_id = sync_engine.upload_file(file_path)
-                                print(f"Processed file in directory: {file_path} with ID: {file_id}")
-                            except Exception as e:
-                                print(f"Error processing file {file_path}: {e}")
+                    logger.debug("Scanning directory: %s", new_path)
+                    for entry in _iter_tree(new_path):
+                        if entry.is_dir():
+                            continue
+
+                        try:
+                            # Process the file
+                            file_id = sync_engine.upload_file(entry.path, entry.stat())
+                            logger.debug("Processed file in directory: %s with ID: %s", entry.path, file_id)
+                        except Exception as e:
+                            logger.error("Error processing file %s: %s", entry.path, e)
 
             elif event_type == 'move_to':
                 # Handle file moved to the sync directory
-                print(f"Handling file moved to sync directory: {path}")
-
-                # Get the folder ID for this file's directory
-                file_dir = os.path.dirname(path)
-                folder = db.query(Folders).filter(Folders.folder_path == file_dir).first()
-
-                if folder:
-                    print(f"Found folder for file: {folder.folder_name} (ID: {folder.folder_id})")
-                    # Calculate file hash for content tracking
-                    file_hash = sync_engine.calculate_file_hash(path)
-
-                    # Extract file name
-                    file_name = os.path.basename(path)
-
-                    # Get file type from extension
-                    _, file_extension = os.path.splitext(path)
-                    file_type = file_extension[1:] if file_extension else "unknown"
-
-                    # Create file metadata with the correct folder ID
-                    file_id = str(uuid.uuid4())
-                    file_metadata = FilesMetaData(
-                        file_id=file_id,
-                        file_type=file_type,
-                        file_path=path,
-                        folder_id=folder.folder_id,  # Use the correct folder ID
-                        file_name=file_name,
-                        file_hash=file_hash
-                    )
-
-                    # Add to database
-                    db.add(file_metadata)
-                    db.commit()
-                    print(f"Added file to database with correct folder: {path} with ID: {file_id}")
-
-                    # Process file chunks
-                    sync_engine._process_file_chunks(path, file_id)
-                else:
-                    # For files without a matching folder, use the normal upload process
-                    file_id = sync_engine.upload_file(path)
-                    print(f"Uploaded moved file: {path} with ID: {file_id}")
-
+                logger.debug("Handling file moved to sync directory: %s", path)
+
+                # Stat for change tracking; a file renamed within the filesystem keeps its
+                # inode, so a hash it had before the move is reused, otherwise the hash is
+                # computed while chunking. The file's row is written once the upload has been
+                # confirmed, so the database isn't locked while it uploads
+                file_stat = os.stat(path)
+                file_id = sync_engine.upload_file(path, file_stat, sync_engine._cached_file_hash(file_stat))
+                logger.debug("Uploaded moved file: %s with ID: %s", path, file_id)
+
+        except Exception:
+            # Don't leave a failed event's changes pending for the next one, and don't
+            # trust folder IDs cached while handling it
+            db.rollback()
+            sync_engine._folder_cache.clear()
+            raise
         finally:
-            db.close()
+            # Rows loaded for this event may be changed by other sessions before the next one
+            db.expire_all()
@@ -101,7 +101,7 @@ echo -e "${CYAN}Checking client 1 database...${NC}"
 echo -e "${YELLOW}Waiting a bit longer for file processing (5 seconds)...${NC}"
 sleep 5
 
-ORIGINAL_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$ORIGINAL_FILENAME';")
+ORIGINAL_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$ORIGINAL_FILENAME';")
 if [ -n "$ORIGINAL_FILE_DB_1" ]; then
     echo -e "${GREEN}Original file found in client 1 database: $ORIGINAL_FILE_DB_1${NC}"
     ORIGINAL_FILE_ID_1=$(echo "$ORIGINAL_FILE_DB_1" | cut -d'|' -f1)
@@ -117,11 +117,11 @@ else
 
     if [ "$ANY_FILES" -gt 0 ]; then
         echo -e "${YELLOW}Some files exist. Listing them:${NC}"
-        ALL_FILES=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata LIMIT 5;")
+        ALL_FILES=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata LIMIT 5;")
         echo -e "${YELLOW}$ALL_FILES${NC}"
 
         # Use the first file as original file
-        ORIGINAL_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata LIMIT 1;")
+        ORIGINAL_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata LIMIT 1;")
         echo -e "${GREEN}Using this file as original: $ORIGINAL_FILE_DB_1${NC}"
         ORIGINAL_FILE_ID_1=$(echo "$ORIGINAL_FILE_DB_1" | cut -d'|' -f1)
         ORIGINAL_FILE_HASH_1=$(echo "$ORIGINAL_FILE_DB_1" | cut -d'|' -f3)
@@ -134,7 +134,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 database...${NC}"
-ORIGINAL_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$ORIGINAL_FILENAME';")
+ORIGINAL_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$ORIGINAL_FILENAME';")
 if [ -n "$ORIGINAL_FILE_DB_2" ]; then
     echo -e "${GREEN}Original file found in client 2 database: $ORIGINAL_FILE_DB_2${NC}"
     ORIGINAL_FILE_ID_2=$(echo "$ORIGINAL_FILE_DB_2" | cut -d'|' -f1)
@@ -150,11 +150,11 @@ else
 
     if [ "$ANY_FILES" -gt 0 ]; then
         echo -e "${YELLOW}Some files exist. Listing them:${NC}"
-        ALL_FILES=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata LIMIT 5;")
+        ALL_FILES=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata LIMIT 5;")
         echo -e "${YELLOW}$ALL_FILES${NC}"
 
         # Use the first file as original file
-        ORIGINAL_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata LIMIT 1;")
+        ORIGINAL_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata LIMIT 1;")
         echo -e "${GREEN}Using this file as original: $ORIGINAL_FILE_DB_2${NC}"
         ORIGINAL_FILE_ID_2=$(echo "$ORIGINAL_FILE_DB_2" | cut -d'|' -f1)
         ORIGINAL_FILE_HASH_2=$(echo "$ORIGINAL_FILE_DB_2" | cut -d'|' -f3)
@@ -170,7 +170,7 @@ echo -e "\n${YELLOW}Step 6: Getting original chunk information for both clients.
 
 # Check client 1
 echo -e "${CYAN}Checking client 1 chunks...${NC}"
-ORIGINAL_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$ORIGINAL_FILE_ID_1';")
+ORIGINAL_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$ORIGINAL_FILE_ID_1';")
 if [ -n "$ORIGINAL_CHUNKS_1" ]; then
     ORIGINAL_CHUNKS_COUNT_1=$(echo "$ORIGINAL_CHUNKS_1" | wc -l)
     echo -e "${GREEN}Found $ORIGINAL_CHUNKS_COUNT_1 chunks for original file in client 1${NC}"
@@ -186,7 +186,7 @@ else
 
     if [ "$ANY_CHUNKS" -gt 0 ]; then
         echo -e "${YELLOW}Some chunks exist. Listing them:${NC}"
-        ALL_CHUNKS=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, fingerprint FROM chunks LIMIT 5;")
+        ALL_CHUNKS=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, lower(hex(fingerprint)) FROM chunks LIMIT 5;")
         echo -e "${YELLOW}$ALL_CHUNKS${NC}"
         echo -e "${YELLOW}(Showing first 5 chunks only)${NC}"
     fi
@@ -198,7 +198,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 chunks...${NC}"
-ORIGINAL_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$ORIGINAL_FILE_ID_2';")
+ORIGINAL_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$ORIGINAL_FILE_ID_2';")
 if [ -n "$ORIGINAL_CHUNKS_2" ]; then
     ORIGINAL_CHUNKS_COUNT_2=$(echo "$ORIGINAL_CHUNKS_2" | wc -l)
     echo -e "${GREEN}Found $ORIGINAL_CHUNKS_COUNT_2 chunks for original file in client 2${NC}"
@@ -214,7 +214,7 @@ else
 
     if [ "$ANY_CHUNKS" -gt 0 ]; then
         echo -e "${YELLOW}Some chunks exist. Listing them:${NC}"
-        ALL_CHUNKS=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, fingerprint FROM chunks LIMIT 5;")
+        ALL_CHUNKS=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, lower(hex(fingerprint)) FROM chunks LIMIT 5;")
         echo -e "${YELLOW}$ALL_CHUNKS${NC}"
         echo -e "${YELLOW}(Showing first 5 chunks only)${NC}"
     fi
@@ -275,7 +275,7 @@ echo -e "\n${YELLOW}Step 11: Verifying duplicate file is in the database for bot
 
 # Check client 1
 echo -e "${CYAN}Checking client 1 database...${NC}"
-DUPLICATE_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$DUPLICATE_FILENAME';")
+DUPLICATE_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$DUPLICATE_FILENAME';")
 if [ -n "$DUPLICATE_FILE_DB_1" ]; then
     echo -e "${GREEN}Duplicate file found in client 1 database: $DUPLICATE_FILE_DB_1${NC}"
     DUPLICATE_FILE_ID_1=$(echo "$DUPLICATE_FILE_DB_1" | cut -d'|' -f1)
@@ -299,7 +299,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 database...${NC}"
-DUPLICATE_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$DUPLICATE_FILENAME';")
+DUPLICATE_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$DUPLICATE_FILENAME';")
 if [ -n "$DUPLICATE_FILE_DB_2" ]; then
     echo -e "${GREEN}Duplicate file found in client 2 database: $DUPLICATE_FILE_DB_2${NC}"
     DUPLICATE_FILE_ID_2=$(echo "$DUPLICATE_FILE_DB_2" | cut -d'|' -f1)
@@ -326,7 +326,7 @@ echo -e "\n${YELLOW}Step 12: Checking if deduplication is working by comparing c
 
 # Check client 1
 echo -e "${CYAN}Checking client 1 chunks...${NC}"
-DUPLICATE_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$DUPLICATE_FILE_ID_1';")
+DUPLICATE_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$DUPLICATE_FILE_ID_1';")
 if [ -n "$DUPLICATE_CHUNKS_1" ]; then
     DUPLICATE_CHUNKS_COUNT_1=$(echo "$DUPLICATE_CHUNKS_1" | wc -l)
     echo -e "${GREEN}Found $DUPLICATE_CHUNKS_COUNT_1 chunks for duplicate file in client 1${NC}"
@@ -357,7 +357,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 chunks...${NC}"
-DUPLICATE_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$DUPLICATE_FILE_ID_2';")
+DUPLICATE_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$DUPLICATE_FILE_ID_2';")
 if [ -n "$DUPLICATE_CHUNKS_2" ]; then
     DUPLICATE_CHUNKS_COUNT_2=$(echo "$DUPLICATE_CHUNKS_2" | wc -l)
     echo -e "${GREEN}Found $DUPLICATE_CHUNKS_COUNT_2 chunks for duplicate file in client 2${NC}"
@@ -98,7 +98,7 @@ echo -e "\n${YELLOW}Step 5: Checking if file is in the database for both clients
 
 # Check client 1
 echo -e "${CYAN}Checking client 1 database...${NC}"
-FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$FILE_DB_1" ]; then
     echo -e "${GREEN}File found in client 1 database:${NC}"
     echo -e "${GREEN}$FILE_DB_1${NC}"
@@ -113,7 +113,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 database...${NC}"
-FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$FILE_DB_2" ]; then
     echo -e "${GREEN}File found in client 2 database:${NC}"
     echo -e "${GREEN}$FILE_DB_2${NC}"
@@ -131,7 +131,7 @@ echo -e "\n${YELLOW}Step 6: Checking for initial chunks for both clients...${NC}
 
 # Check client 1
 echo -e "${CYAN}Checking client 1 chunks...${NC}"
-ORIGINAL_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$FILE_ID_1';")
+ORIGINAL_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID_1';")
 if [ -n "$ORIGINAL_CHUNKS_1" ]; then
     ORIGINAL_CHUNKS_COUNT_1=$(echo "$ORIGINAL_CHUNKS_1" | wc -l)
     echo -e "${GREEN}Found $ORIGINAL_CHUNKS_COUNT_1 original chunks in client 1 database${NC}"
@@ -144,7 +144,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 chunks...${NC}"
-ORIGINAL_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$FILE_ID_2';")
+ORIGINAL_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID_2';")
 if [ -n "$ORIGINAL_CHUNKS_2" ]; then
     ORIGINAL_CHUNKS_COUNT_2=$(echo "$ORIGINAL_CHUNKS_2" | wc -l)
     echo -e "${GREEN}Found $ORIGINAL_CHUNKS_COUNT_2 original chunks in client 2 database${NC}"
@@ -205,7 +205,7 @@ check_file_and_chunks() {
     sleep $seconds
 
     # Check if file exists in database by name
-    local file_db=$(docker exec $client_name sqlite3 $DB_PATH "SELECT file_id, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+    local file_db=$(docker exec $client_name sqlite3 $DB_PATH "SELECT file_id, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
     if [ -n "$file_db" ]; then
         local current_file_id=$(echo "$file_db" | cut -d'|' -f1)
         local current_hash=$(echo "$file_db" | cut -d'|' -f2)
@@ -229,7 +229,7 @@ check_file_and_chunks() {
         fi
 
         # Check chunks
-        local chunks=$(docker exec $client_name sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$current_file_id';")
+        local chunks=$(docker exec $client_name sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$current_file_id';")
         if [ -n "$chunks" ]; then
             local chunks_count=$(echo "$chunks" | wc -l)
             echo -e "${GREEN}Found $chunks_count chunks for file ID $current_file_id${NC}"
@@ -241,7 +241,7 @@ check_file_and_chunks() {
             echo -e "${YELLOW}This might be expected if the system is still processing the file${NC}"
             echo -e "${YELLOW}Checking if chunks exist for the original file ID...${NC}"
 
-            local original_chunks=$(docker exec $client_name sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$original_file_id';")
+            local original_chunks=$(docker exec $client_name sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$original_file_id';")
             if [ -n "$original_chunks" ]; then
                 local original_chunks_count=$(echo "$original_chunks" | wc -l)
                 echo -e "${GREEN}Found $original_chunks_count chunks for original file ID $original_file_id${NC}"
@@ -256,7 +256,7 @@ check_file_and_chunks() {
         echo -e "${YELLOW}This might be expected if the system is still processing the file${NC}"
         echo -e "${YELLOW}Checking if the original file still exists...${NC}"
 
-        local original_file_db=$(docker exec $client_name sqlite3 $DB_PATH "SELECT file_id, file_hash FROM files_metadata WHERE file_id='$original_file_id';")
+        local original_file_db=$(docker exec $client_name sqlite3 $DB_PATH "SELECT file_id, lower(hex(file_hash)) FROM files_metadata WHERE file_id='$original_file_id';")
         if [ -n "$original_file_db" ]; then
             echo -e "${GREEN}Original file still exists in database: $original_file_db${NC}"
         else
@@ -98,7 +98,7 @@ sleep $WAIT_TIME
 echo -e "\n${YELLOW}Step 5: Checking if file is in the database for both clients...${NC}"
 
 # Check client 1
-FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$FILE_DB_1" ]; then
     echo -e "${GREEN}File found in client 1 database: $FILE_DB_1${NC}"
     FILE_ID_1=$(echo "$FILE_DB_1" | cut -d'|' -f1)
@@ -110,7 +110,7 @@ else
 fi
 
 # Check client 2
-FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$FILE_DB_2" ]; then
     echo -e "${GREEN}File found in client 2 database: $FILE_DB_2${NC}"
     FILE_ID_2=$(echo "$FILE_DB_2" | cut -d'|' -f1)
@@ -165,7 +165,7 @@ sleep $WAIT_TIME
 echo -e "\n${YELLOW}Step 10: Checking if file hash has been updated in the database for both clients...${NC}"
 
 # Check client 1
-NEW_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+NEW_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$NEW_FILE_DB_1" ]; then
     echo -e "${GREEN}File found in client 1 database after modification: $NEW_FILE_DB_1${NC}"
     NEW_FILE_ID_1=$(echo "$NEW_FILE_DB_1" | cut -d'|' -f1)
@@ -184,7 +184,7 @@ else
 fi
 
 # Check client 2
-NEW_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+NEW_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$NEW_FILE_DB_2" ]; then
     echo -e "${GREEN}File found in client 2 database after modification: $NEW_FILE_DB_2${NC}"
     NEW_FILE_ID_2=$(echo "$NEW_FILE_DB_2" | cut -d'|' -f1)
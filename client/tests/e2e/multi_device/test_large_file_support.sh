@@ -124,7 +124,7 @@ echo -e "\n${YELLOW}Step 6: Checking if large file is in the database for both c
 
 # Check client 1
 echo -e "${CYAN}Checking client 1 database...${NC}"
-LARGE_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$LARGE_FILENAME';")
+LARGE_FILE_DB_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$LARGE_FILENAME';")
 if [ -n "$LARGE_FILE_DB_1" ]; then
     echo -e "${GREEN}Large file found in client 1 database:${NC}"
     echo -e "${GREEN}$LARGE_FILE_DB_1${NC}"
@@ -139,7 +139,7 @@ fi
 
 # Check client 2
 echo -e "${CYAN}Checking client 2 database...${NC}"
-LARGE_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$LARGE_FILENAME';")
+LARGE_FILE_DB_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$LARGE_FILENAME';")
 if [ -n "$LARGE_FILE_DB_2" ]; then
     echo -e "${GREEN}Large file found in client 2 database:${NC}"
     echo -e "${GREEN}$LARGE_FILE_DB_2${NC}"
@@ -174,7 +174,7 @@ if [ "$CHUNKS_COUNT_1" -gt 0 ]; then
     fi
 
     # Get chunk details
-    CHUNKS_DETAILS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint, part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_1' ORDER BY part_number LIMIT 5;")
+    CHUNKS_DETAILS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)), part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_1' ORDER BY part_number LIMIT 5;")
     echo -e "${CYAN}Chunk details in client 1:${NC}"
     echo -e "${CYAN}$CHUNKS_DETAILS_1${NC}"
     echo -e "${CYAN}(Showing first 5 chunks only)${NC}"
@@ -188,7 +188,7 @@ else
 
     if [ "$ANY_CHUNKS" -gt 0 ]; then
         echo -e "${YELLOW}Some chunks exist. Listing them:${NC}"
-        ALL_CHUNKS=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, fingerprint FROM chunks LIMIT 5;")
+        ALL_CHUNKS=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, lower(hex(fingerprint)) FROM chunks LIMIT 5;")
         echo -e "${YELLOW}$ALL_CHUNKS${NC}"
         echo -e "${YELLOW}(Showing first 5 chunks only)${NC}"
     fi
@@ -209,7 +209,7 @@ if [ "$CHUNKS_COUNT_2" -gt 0 ]; then
     fi
 
     # Get chunk details
-    CHUNKS_DETAILS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint, part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_2' ORDER BY part_number LIMIT 5;")
+    CHUNKS_DETAILS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)), part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_2' ORDER BY part_number LIMIT 5;")
     echo -e "${CYAN}Chunk details in client 2:${NC}"
     echo -e "${CYAN}$CHUNKS_DETAILS_2${NC}"
     echo -e "${CYAN}(Showing first 5 chunks only)${NC}"
@@ -223,7 +223,7 @@ else
 
     if [ "$ANY_CHUNKS" -gt 0 ]; then
         echo -e "${YELLOW}Some chunks exist. Listing them:${NC}"
-        ALL_CHUNKS=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, fingerprint FROM chunks LIMIT 5;")
+        ALL_CHUNKS=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, file_id, lower(hex(fingerprint)) FROM chunks LIMIT 5;")
         echo -e "${YELLOW}$ALL_CHUNKS${NC}"
         echo -e "${YELLOW}(Showing first 5 chunks only)${NC}"
     fi
@@ -233,7 +233,7 @@ fi
 echo -e "\n${YELLOW}Step 8: Testing downloading a subset of chunks from client 1...${NC}"
 
 # Get the first two chunks for download
-FIRST_TWO_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint, part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_1' ORDER BY part_number LIMIT 2;")
+FIRST_TWO_CHUNKS_1=$(docker exec $CLIENT1_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)), part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_1' ORDER BY part_number LIMIT 2;")
 CHUNK1_ID_1=$(echo "$FIRST_TWO_CHUNKS_1" | head -1 | cut -d'|' -f1)
 CHUNK1_FINGERPRINT_1=$(echo "$FIRST_TWO_CHUNKS_1" | head -1 | cut -d'|' -f2)
 CHUNK1_PART_1=$(echo "$FIRST_TWO_CHUNKS_1" | head -1 | cut -d'|' -f3)
@@ -333,7 +333,7 @@ fi
 echo -e "\n${YELLOW}Step 12: Testing downloading a subset of chunks from client 2...${NC}"
 
 # Get the first two chunks for download
-FIRST_TWO_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint, part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_2' ORDER BY part_number LIMIT 2;")
+FIRST_TWO_CHUNKS_2=$(docker exec $CLIENT2_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)), part_number FROM chunks WHERE file_id='$LARGE_FILE_ID_2' ORDER BY part_number LIMIT 2;")
 CHUNK1_ID_2=$(echo "$FIRST_TWO_CHUNKS_2" | head -1 | cut -d'|' -f1)
 CHUNK1_FINGERPRINT_2=$(echo "$FIRST_TWO_CHUNKS_2" | head -1 | cut -d'|' -f2)
 CHUNK1_PART_2=$(echo "$FIRST_TWO_CHUNKS_2" | head -1 | cut -d'|' -f3)
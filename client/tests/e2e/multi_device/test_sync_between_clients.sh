@@ -153,7 +153,7 @@ get_chunk_fingerprints() {
     fi
 
     # Then get all chunk fingerprints for this file
-    docker exec $container bash -c "sqlite3 /app/data/firebox.db 'SELECT fingerprint FROM chunks WHERE file_id=\"$file_id\" ORDER BY part_number;'" | tr '\n' '|'
+    docker exec $container bash -c "sqlite3 /app/data/firebox.db 'SELECT lower(hex(fingerprint)) FROM chunks WHERE file_id=\"$file_id\" ORDER BY part_number;'" | tr '\n' '|'
 }
 
 # Function to compare fingerprints between containers
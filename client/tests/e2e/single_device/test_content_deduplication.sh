@@ -78,7 +78,7 @@ sleep $WAIT_TIME
 
 # Step 4: Verify original file is in the database
 echo -e "\n${YELLOW}Step 4: Verifying original file is in the database...${NC}"
-ORIGINAL_DB=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$ORIGINAL_FILENAME';")
+ORIGINAL_DB=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$ORIGINAL_FILENAME';")
 if [ -n "$ORIGINAL_DB" ]; then
     echo -e "${GREEN}Original file found in database: $ORIGINAL_DB${NC}"
     ORIGINAL_ID=$(echo "$ORIGINAL_DB" | cut -d'|' -f1)
@@ -98,7 +98,7 @@ if [ "$ORIGINAL_CHUNKS" -gt 0 ]; then
     
     # Get original chunk fingerprints
     echo -e "${YELLOW}Original chunk fingerprints:${NC}"
-    ORIGINAL_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$ORIGINAL_ID';")
+    ORIGINAL_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$ORIGINAL_ID';")
     echo -e "$ORIGINAL_FINGERPRINTS"
 else
     echo -e "${RED}No chunks found for original file${NC}"
@@ -143,7 +143,7 @@ sleep $WAIT_TIME
 
 # Step 9: Verify duplicate file is in the database
 echo -e "\n${YELLOW}Step 9: Verifying duplicate file is in the database...${NC}"
-DUPLICATE_DB=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$DUPLICATE_FILENAME';")
+DUPLICATE_DB=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$DUPLICATE_FILENAME';")
 if [ -n "$DUPLICATE_DB" ]; then
     echo -e "${GREEN}Duplicate file found in database: $DUPLICATE_DB${NC}"
     DUPLICATE_ID=$(echo "$DUPLICATE_DB" | cut -d'|' -f1)
@@ -173,13 +173,13 @@ if [ "$DUPLICATE_CHUNKS" -gt 0 ]; then
     
     # Get duplicate chunk fingerprints
     echo -e "${YELLOW}Duplicate chunk fingerprints:${NC}"
-    DUPLICATE_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$DUPLICATE_ID';")
+    DUPLICATE_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$DUPLICATE_ID';")
     echo -e "$DUPLICATE_FINGERPRINTS"
     
     # Compare fingerprints
     # Note: The chunk IDs will be different, but the fingerprints should be the same
-    ORIGINAL_FINGERPRINT_LIST=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT fingerprint FROM chunks WHERE file_id='$ORIGINAL_ID' ORDER BY fingerprint;")
-    DUPLICATE_FINGERPRINT_LIST=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT fingerprint FROM chunks WHERE file_id='$DUPLICATE_ID' ORDER BY fingerprint;")
+    ORIGINAL_FINGERPRINT_LIST=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT lower(hex(fingerprint)) FROM chunks WHERE file_id='$ORIGINAL_ID' ORDER BY fingerprint;")
+    DUPLICATE_FINGERPRINT_LIST=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT lower(hex(fingerprint)) FROM chunks WHERE file_id='$DUPLICATE_ID' ORDER BY fingerprint;")
     
     if [ "$ORIGINAL_FINGERPRINT_LIST" = "$DUPLICATE_FINGERPRINT_LIST" ]; then
         echo -e "${GREEN}Chunk fingerprints match between original and duplicate files - GOOD!${NC}"
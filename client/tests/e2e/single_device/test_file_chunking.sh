@@ -88,7 +88,7 @@ fi
 
 # Step 5: Check if file is in the database
 echo -e "\n${YELLOW}Step 5: Checking if file is in the database...${NC}"
-DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$DB_RESULT" ]; then
     echo -e "${GREEN}File found in database:${NC}"
     echo -e "$DB_RESULT"
@@ -135,24 +135,24 @@ if [ "$CHUNKS_RESULT" -gt 0 ]; then
     
     # Show chunk details including fingerprints
     echo -e "${YELLOW}Chunk details:${NC}"
-    CHUNK_DETAILS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint, part_number FROM chunks WHERE file_id='$FILE_ID' ORDER BY part_number;")
+    CHUNK_DETAILS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)), part_number FROM chunks WHERE file_id='$FILE_ID' ORDER BY part_number;")
     echo -e "$CHUNK_DETAILS"
     
     # Check if any chunks are missing fingerprints
-    MISSING_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT COUNT(*) FROM chunks WHERE file_id='$FILE_ID' AND (fingerprint IS NULL OR fingerprint = '');")
+    MISSING_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT COUNT(*) FROM chunks WHERE file_id='$FILE_ID' AND (fingerprint IS NULL OR length(fingerprint) = 0);")
     
     if [ "$MISSING_FINGERPRINTS" -gt 0 ]; then
         echo -e "${RED}WARNING: $MISSING_FINGERPRINTS chunks are missing fingerprints!${NC}"
     else
         echo -e "${GREEN}All chunks have fingerprints - GOOD!${NC}"
         
-        # Verify fingerprint format (should be SHA-256 hash - 64 hex characters)
-        INVALID_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT COUNT(*) FROM chunks WHERE file_id='$FILE_ID' AND length(fingerprint) != 64;")
+        # Verify fingerprint format (should be a raw SHA-256 digest - 32 bytes)
+        INVALID_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT COUNT(*) FROM chunks WHERE file_id='$FILE_ID' AND length(fingerprint) != 32;")
         
         if [ "$INVALID_FINGERPRINTS" -gt 0 ]; then
             echo -e "${RED}WARNING: $INVALID_FINGERPRINTS chunks have invalid fingerprint format!${NC}"
         else
-            echo -e "${GREEN}All fingerprints have valid format (64 hex characters) - GOOD!${NC}"
+            echo -e "${GREEN}All fingerprints have valid format (32-byte SHA-256 digests) - GOOD!${NC}"
         fi
     fi
 else
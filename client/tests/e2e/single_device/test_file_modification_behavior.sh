@@ -85,7 +85,7 @@ sleep $INITIAL_WAIT_TIME
 
 # Step 4: Check if file is in the database
 echo -e "\n${YELLOW}Step 4: Checking if file is in the database...${NC}"
-DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$DB_RESULT" ]; then
     echo -e "${GREEN}File found in database:${NC}"
     echo -e "$DB_RESULT"
@@ -108,7 +108,7 @@ if [ "$ORIGINAL_CHUNKS" -gt 0 ]; then
 
     # Get original chunk fingerprints
     echo -e "${YELLOW}Original chunk fingerprints:${NC}"
-    ORIGINAL_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$FILE_ID';")
+    ORIGINAL_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID';")
     echo -e "$ORIGINAL_FINGERPRINTS"
 else
     echo -e "${RED}No original chunks found in database${NC}"
@@ -151,7 +151,7 @@ check_chunks() {
     echo -e "\n${CYAN}Checking for chunks after ${wait_time} seconds...${NC}"
 
     # Check if file still exists by name
-    DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+    DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
     if [ -n "$DB_RESULT" ]; then
         echo -e "${GREEN}File found in database by name: $DB_RESULT${NC}"
         CURRENT_FILE_ID=$(echo "$DB_RESULT" | cut -d'|' -f1)
@@ -179,7 +179,7 @@ check_chunks() {
         echo -e "${RED}File not found in database by name!${NC}"
 
         # Check if the original file still exists by ID
-        DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_hash FROM files_metadata WHERE file_id='$FILE_ID';")
+        DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, lower(hex(file_hash)) FROM files_metadata WHERE file_id='$FILE_ID';")
         if [ -n "$DB_RESULT" ]; then
             echo -e "${GREEN}Original file still exists by ID: $DB_RESULT${NC}"
         else
@@ -196,7 +196,7 @@ check_chunks() {
 
         # Get chunk fingerprints
         echo -e "${YELLOW}Chunk fingerprints:${NC}"
-        CHUNK_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$FILE_ID';")
+        CHUNK_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID';")
         echo -e "$CHUNK_FINGERPRINTS"
 
         # Check if fingerprints have changed
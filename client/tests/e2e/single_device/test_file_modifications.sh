@@ -77,7 +77,7 @@ sleep $WAIT_TIME
 
 # Step 4: Check if file is in the database
 echo -e "\n${YELLOW}Step 4: Checking if file is in the database...${NC}"
-DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$DB_RESULT" ]; then
     echo -e "${GREEN}File found in database:${NC}"
     echo -e "$DB_RESULT"
@@ -100,7 +100,7 @@ if [ "$ORIGINAL_CHUNKS" -gt 0 ]; then
 
     # Get original chunk fingerprints
     echo -e "${YELLOW}Original chunk fingerprints:${NC}"
-    ORIGINAL_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$FILE_ID';")
+    ORIGINAL_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID';")
     echo -e "$ORIGINAL_FINGERPRINTS"
 else
     echo -e "${RED}No original chunks found in database${NC}"
@@ -140,7 +140,7 @@ sleep $WAIT_TIME
 
 # Step 9: Check if file hash is updated in the database
 echo -e "\n${YELLOW}Step 9: Checking if file hash is updated in the database...${NC}"
-DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_hash FROM files_metadata WHERE file_name='$TEST_FILENAME';")
+DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$TEST_FILENAME';")
 if [ -n "$DB_RESULT" ]; then
     # Extract updated hash
     DB_MODIFIED_HASH=$(echo "$DB_RESULT" | cut -d'|' -f2)
@@ -164,7 +164,7 @@ echo -e "\n${YELLOW}Step 10: Checking if chunks have been updated...${NC}"
 # Important: When a file is modified, the system creates a new file record with a new ID
 # So we need to find the current file ID after modification
 echo -e "${CYAN}Note: The system creates a new file record with a new ID when a file is modified${NC}"
-CURRENT_FILE_DB=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_hash FROM files_metadata WHERE file_name='$(basename $TEST_FILE)';")
+CURRENT_FILE_DB=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$(basename $TEST_FILE)';")
 
 if [ -n "$CURRENT_FILE_DB" ]; then
     CURRENT_FILE_ID=$(echo "$CURRENT_FILE_DB" | cut -d'|' -f1)
@@ -188,7 +188,7 @@ if [ -n "$CURRENT_FILE_DB" ]; then
 
             # Get updated chunk fingerprints
             echo -e "${YELLOW}New file's chunk fingerprints:${NC}"
-            MODIFIED_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$CURRENT_FILE_ID';")
+            MODIFIED_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$CURRENT_FILE_ID';")
             echo -e "$MODIFIED_FINGERPRINTS"
 
             echo -e "${GREEN}Chunks are properly associated with the new file record - GOOD!${NC}"
@@ -204,7 +204,7 @@ if [ -n "$CURRENT_FILE_DB" ]; then
 
             # Get updated chunk fingerprints
             echo -e "${YELLOW}Updated chunk fingerprints:${NC}"
-            MODIFIED_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint FROM chunks WHERE file_id='$FILE_ID';")
+            MODIFIED_FINGERPRINTS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID';")
             echo -e "$MODIFIED_FINGERPRINTS"
 
             # Check if fingerprints have changed
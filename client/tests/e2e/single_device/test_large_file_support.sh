@@ -92,7 +92,7 @@ fi
 
 # Step 5: Check if large file is in the database
 echo -e "\n${YELLOW}Step 5: Checking if large file is in the database...${NC}"
-DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, file_hash FROM files_metadata WHERE file_name='$LARGE_FILENAME';")
+DB_RESULT=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT file_id, file_name, file_path, lower(hex(file_hash)) FROM files_metadata WHERE file_name='$LARGE_FILENAME';")
 if [ -n "$DB_RESULT" ]; then
     echo -e "${GREEN}Large file found in database:${NC}"
     echo -e "$DB_RESULT"
@@ -129,7 +129,7 @@ if [ "$CHUNKS_RESULT" -gt 0 ]; then
     
     # Show chunk details including fingerprints
     echo -e "${YELLOW}Chunk details:${NC}"
-    CHUNK_DETAILS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, fingerprint, part_number FROM chunks WHERE file_id='$FILE_ID' ORDER BY part_number LIMIT 5;")
+    CHUNK_DETAILS=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, lower(hex(fingerprint)), part_number FROM chunks WHERE file_id='$FILE_ID' ORDER BY part_number LIMIT 5;")
     echo -e "$CHUNK_DETAILS"
     echo -e "${CYAN}(Showing first 5 chunks only)${NC}"
 else
@@ -141,7 +141,7 @@ fi
 echo -e "\n${YELLOW}Step 7: Testing downloading a subset of chunks...${NC}"
 
 # Get chunk IDs, part numbers, and fingerprints
-CHUNK_INFO=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, part_number, fingerprint FROM chunks WHERE file_id='$FILE_ID' ORDER BY part_number LIMIT 2;")
+CHUNK_INFO=$(docker exec $CONTAINER_NAME sqlite3 $DB_PATH "SELECT chunk_id, part_number, lower(hex(fingerprint)) FROM chunks WHERE file_id='$FILE_ID' ORDER BY part_number LIMIT 2;")
 
 # Parse chunk info
 CHUNK_IDS=()
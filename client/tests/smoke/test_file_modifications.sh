@@ -39,7 +39,7 @@ sleep 3
 
 # Step 3: Get original file hash
 echo -e "\n${YELLOW}Step 3: Getting original file hash...${NC}"
-ORIGINAL_HASH=$(docker exec firebox-client-1 sqlite3 /app/data/firebox.db "SELECT file_hash FROM files_metadata WHERE file_name='modification_test.txt';")
+ORIGINAL_HASH=$(docker exec firebox-client-1 sqlite3 /app/data/firebox.db "SELECT lower(hex(file_hash)) FROM files_metadata WHERE file_name='modification_test.txt';")
 echo -e "Original file hash: $ORIGINAL_HASH"
 
 # Step 4: Modify the file
@@ -58,7 +58,7 @@ sleep 3
 
 # Step 6: Get new file hash
 echo -e "\n${YELLOW}Step 6: Getting new file hash...${NC}"
-NEW_HASH=$(docker exec firebox-client-1 sqlite3 /app/data/firebox.db "SELECT file_hash FROM files_metadata WHERE file_name='modification_test.txt';")
+NEW_HASH=$(docker exec firebox-client-1 sqlite3 /app/data/firebox.db "SELECT lower(hex(file_hash)) FROM files_metadata WHERE file_name='modification_test.txt';")
 echo -e "New file hash: $NEW_HASH"
 
 # Step 7: Compare hashes
@@ -24,7 +24,7 @@ mkdir -p "${CHUNK_DIR}"
 # Always recreate the database file to ensure it's clean
 echo "Recreating database file..."
 mkdir -p "${APP_DIR}/data"
-rm -f "$DB_FILE"
+rm -f "$DB_FILE" "$DB_FILE-wal" "$DB_FILE-shm"
 touch "$DB_FILE"
 
 # Set PYTHONPATH to include current directory for module imports